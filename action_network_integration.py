@@ -3,14 +3,36 @@
 import argparse
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 import logging
 
+import pandas as pd
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ingest.action_network.data_collector import ActionNetworkCollector
 from ingest.action_network.analysis_tools import ActionNetworkAnalyzer
 from ingest.action_network.team_mapper import ActionNetworkTeamMapper
 
 
+@lru_cache(maxsize=1)
+def _analyzer():
+    """Shared ActionNetworkAnalyzer instance for the process."""
+    return ActionNetworkAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def _mapper():
+    """Shared ActionNetworkTeamMapper instance for the process."""
+    return ActionNetworkTeamMapper()
+
+
 def setup_logging(level=logging.INFO):
     """Setup logging configuration."""
     logging.basicConfig(
@@ -51,8 +73,13 @@ def collect_data(date=None, expert_picks=True, all_picks=True):
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     results_file = f"artifacts/collection_results_{timestamp}.json"
     
-    with open(results_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    if ORJSON_AVAILABLE:
+        Path(results_file).write_bytes(
+            orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str)
+        )
+    else:
+        with open(results_file, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
     
     print(f"Collection results saved to {results_file}")
     return results
@@ -68,17 +95,27 @@ def analyze_data(league='nfl', export_csv=False):
     """
     print(f"Analyzing Action Network data for {league.upper()}...")
     
-    analyzer = ActionNetworkAnalyzer()
-    mapper = ActionNetworkTeamMapper()
+    analyzer = _analyzer()
+    mapper = _mapper()
     
     # Get top experts
     print("\nTop Experts:")
     top_experts = analyzer.get_top_experts(league, limit=10)
-    for i, expert in enumerate(top_experts, 1):
-        print(f"{i:2d}. {expert['name']:<20} | "
-              f"Win Rate: {expert['win_rate']:5.1f}% | "
-              f"Units: {expert['total_units_net']:6.2f} | "
-              f"Picks: {expert['total_picks']:3d}")
+    if top_experts:
+        experts_df = pd.DataFrame(
+            top_experts, columns=['name', 'win_rate', 'total_units_net', 'total_picks']
+        )
+        experts_df.index = range(1, len(experts_df) + 1)
+        print(experts_df.to_string(
+            header=['Name', 'Win Rate', 'Units', 'Picks'],
+            formatters={
+                'name': '{:<20}'.format,
+                'win_rate': '{:5.1f}%'.format,
+                'total_units_net': '{:6.2f}'.format,
+                'total_picks': '{:3d}'.format
+            },
+            justify='left'
+        ))
     
     # Get league summary
     print(f"\n{league.upper()} League Summary:")
@@ -95,11 +132,22 @@ def analyze_data(league='nfl', export_csv=False):
     print(f"\nPick Accuracy by Type ({league.upper()}):")
     accuracy_by_type = analyzer.get_pick_accuracy_by_type(league)
     if 'error' not in accuracy_by_type:
-        for pick_type in accuracy_by_type['pick_types'][:5]:
-            print(f"{pick_type['pick_type']:<15} | "
-                  f"Win Rate: {pick_type['win_rate']:5.1f}% | "
-                  f"Picks: {pick_type['total_picks']:3d} | "
-                  f"Units: {pick_type['avg_units_net']:6.2f}")
+        pick_types_df = pd.DataFrame(
+            accuracy_by_type['pick_types'][:5],
+            columns=['pick_type', 'win_rate', 'total_picks', 'avg_units_net']
+        )
+        if not pick_types_df.empty:
+            print(pick_types_df.to_string(
+                index=False,
+                header=['Pick Type', 'Win Rate', 'Picks', 'Units'],
+                formatters={
+                    'pick_type': '{:<15}'.format,
+                    'win_rate': '{:5.1f}%'.format,
+                    'total_picks': '{:3d}'.format,
+                    'avg_units_net': '{:6.2f}'.format
+                },
+                justify='left'
+            ))
     
     # Get social metrics analysis
     print(f"\nSocial Metrics Analysis ({league.upper()}):")
@@ -118,7 +166,7 @@ def analyze_data(league='nfl', export_csv=False):
     print(f"\nNFL Team Mappings:")
     nfl_mapping = mapper.map_nfl_teams_to_standard()
     print(f"Total NFL teams mapped: {len(nfl_mapping)}")
-    for an_id, team_name in list(nfl_mapping.items())[:5]:
+    for an_id, team_name in islice(nfl_mapping.items(), 5):
         print(f"  AN ID {an_id}: {team_name}")
     
     # Export to CSV if requested
@@ -145,8 +193,8 @@ def get_expert_details(expert_name, days=30):
     """
     print(f"Getting detailed analysis for expert: {expert_name}")
     
-    analyzer = ActionNetworkAnalyzer()
-    mapper = ActionNetworkTeamMapper()
+    analyzer = _analyzer()
+    mapper = _mapper()
     
     # Get expert trends
     trends = analyzer.get_expert_trends(expert_name, days)
@@ -5,23 +5,156 @@ Handles multiple data sources including NFL.com, ESPN, and other sources
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import pandas as pd
 from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
 import json
 import time
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from operator import attrgetter
 import random
 import urllib.parse
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Optional fast JSON parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional faster HTML parser backend for BeautifulSoup
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional HTTP response cache for repeated scoreboard polling
+try:
+    from requests_cache import CachedSession
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Optional async HTTP client
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Static request headers; only the User-Agent varies per request. No Cache-Control: a
+# max-age=0 request header would make requests-cache skip its stored response every time
+_BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Referer': 'https://www.google.com/'
+}
+
+# Browser user agents rotated across requests
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14.2; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (iPad; CPU OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Mobile/15E148 Safari/604.1',
+    'Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
+    'Mozilla/5.0 (Linux; Android 13; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 OPR/106.0.0.0',
+)
+
+# Minimum seconds between requests to a host (matched on domain suffix),
+# keeping the scraper under the site's rate limit instead of reacting to 429s
+HOST_MIN_INTERVALS = {
+    'espn.com': 1.0
+}
+
+# How long a cached scoreboard response stays fresh
+RESPONSE_CACHE_TTL = timedelta(seconds=15)
+
+# Team abbreviations
+TEAM_ABBREVIATIONS = {
+    'Arizona Cardinals': 'ARI', 'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL',
+    'Buffalo Bills': 'BUF', 'Carolina Panthers': 'CAR', 'Chicago Bears': 'CHI',
+    'Cincinnati Bengals': 'CIN', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
+    'Denver Broncos': 'DEN', 'Detroit Lions': 'DET', 'Green Bay Packers': 'GB',
+    'Houston Texans': 'HOU', 'Indianapolis Colts': 'IND', 'Jacksonville Jaguars': 'JAX',
+    'Kansas City Chiefs': 'KC', 'Las Vegas Raiders': 'LV', 'Los Angeles Chargers': 'LAC',
+    'Los Angeles Rams': 'LAR', 'Miami Dolphins': 'MIA', 'Minnesota Vikings': 'MIN',
+    'New England Patriots': 'NE', 'New Orleans Saints': 'NO', 'New York Giants': 'NYG',
+    'New York Jets': 'NYJ', 'Philadelphia Eagles': 'PHI', 'Pittsburgh Steelers': 'PIT',
+    'San Francisco 49ers': 'SF', 'Seattle Seahawks': 'SEA', 'Tampa Bay Buccaneers': 'TB',
+    'Tennessee Titans': 'TEN', 'Washington Commanders': 'WAS'
+}
+
+# Status mapping
+STATUS_MAPPING = {
+    'FINAL': 'final', 'FINAL/OT': 'final', 'LIVE': 'in_progress',
+    'IN PROGRESS': 'in_progress', 'HALFTIME': 'in_progress',
+    'PREGAME': 'scheduled', 'POSTPONED': 'postponed', 'CANCELLED': 'cancelled'
+}
+
+# ESPN API status.type.name values, keyed exactly as ESPN returns them
+ESPN_STATUS_MAPPING = {
+    'STATUS_FINAL': 'final', 'STATUS_FINAL_OVERTIME': 'final',
+    'STATUS_IN_PROGRESS': 'in_progress', 'STATUS_HALFTIME': 'in_progress',
+    'STATUS_END_PERIOD': 'in_progress', 'STATUS_DELAYED': 'in_progress',
+    'STATUS_SCHEDULED': 'scheduled', 'STATUS_POSTPONED': 'postponed',
+    'STATUS_CANCELED': 'cancelled'
+}
+
+class _HostThrottleAdapter(HTTPAdapter):
+    """Transport adapter that waits for the host's request slot before going to the network.
+    
+    Mounted on the session, so responses requests-cache serves from memory never reach it
+    and are not paced.
+    """
+    
+    def __init__(self, reserve_slot, **kwargs):
+        super().__init__(**kwargs)
+        self._reserve_slot = reserve_slot
+    
+    def send(self, request, **kwargs):
+        wait_time = self._reserve_slot(request.url)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return super().send(request, **kwargs)
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class AdvancedGameData:
     """Advanced game data structure"""
     game_id: str
@@ -40,15 +173,47 @@ class AdvancedGameData:
     weather: Optional[str] = None
     temperature: Optional[int] = None
     wind_speed: Optional[int] = None
-    last_update: str = None
+    last_update: Optional[str] = None
     source: str = "unknown"
 
+# Column order for tabular exports of AdvancedGameData
+GAME_DATA_FIELDS = tuple(f.name for f in fields(AdvancedGameData))
+_game_data_row = attrgetter(*GAME_DATA_FIELDS)
+
 class AdvancedNFLScraper:
     """Advanced NFL scraper with multiple data sources"""
     
+    # Score line pattern in HTML game cards, e.g. "KC 21 - BUF 17"
+    _TEAM_RE = re.compile(r'([A-Z]{2,4})\s*(\d+)\s*-\s*([A-Z]{2,4})\s*(\d+)')
+    
+    # CSS selectors that may hold game cards, combined so the DOM is walked once
+    _GAME_SELECTORS = (
+        '.nfl-c-game-card',
+        '.game-card',
+        '.score-card',
+        '[data-testid*="game"]',
+        '.nfl-s-scoreboard-game',
+        '.game',
+        '.scoreboard-game'
+    )
+    _JOINED_SELECTOR = ', '.join(_GAME_SELECTORS)
+    
     def __init__(self):
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        if REQUESTS_CACHE_AVAILABLE:
+            self.session = CachedSession(
+                backend='memory',
+                expire_after=RESPONSE_CACHE_TTL,
+                allowable_codes=(200,)
+            )
+        else:
+            self.session = requests.Session()
+        
+        # Per-host time of the next allowed request, enforced only on real network sends
+        self._host_next_request: Dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+        throttle = _HostThrottleAdapter(self._reserve_request_slot)
+        self.session.mount('https://', throttle)
+        self.session.mount('http://', throttle)
         
         # Data sources
         self.sources = {
@@ -64,68 +229,55 @@ class AdvancedNFLScraper:
             }
         }
         
-        # Team abbreviations
-        self.team_abbreviations = {
-            'Arizona Cardinals': 'ARI', 'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL',
-            'Buffalo Bills': 'BUF', 'Carolina Panthers': 'CAR', 'Chicago Bears': 'CHI',
-            'Cincinnati Bengals': 'CIN', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
-            'Denver Broncos': 'DEN', 'Detroit Lions': 'DET', 'Green Bay Packers': 'GB',
-            'Houston Texans': 'HOU', 'Indianapolis Colts': 'IND', 'Jacksonville Jaguars': 'JAX',
-            'Kansas City Chiefs': 'KC', 'Las Vegas Raiders': 'LV', 'Los Angeles Chargers': 'LAC',
-            'Los Angeles Rams': 'LAR', 'Miami Dolphins': 'MIA', 'Minnesota Vikings': 'MIN',
-            'New England Patriots': 'NE', 'New Orleans Saints': 'NO', 'New York Giants': 'NYG',
-            'New York Jets': 'NYJ', 'Philadelphia Eagles': 'PHI', 'Pittsburgh Steelers': 'PIT',
-            'San Francisco 49ers': 'SF', 'Seattle Seahawks': 'SEA', 'Tampa Bay Buccaneers': 'TB',
-            'Tennessee Titans': 'TEN', 'Washington Commanders': 'WAS'
-        }
-        
-        # Status mapping
-        self.status_mapping = {
-            'FINAL': 'final', 'FINAL/OT': 'final', 'LIVE': 'in_progress',
-            'IN PROGRESS': 'in_progress', 'HALFTIME': 'in_progress',
-            'PREGAME': 'scheduled', 'POSTPONED': 'postponed', 'CANCELLED': 'cancelled'
-        }
+        # Shared lookup tables (module-level, built once at import)
+        self.team_abbreviations = TEAM_ABBREVIATIONS
+        self.status_mapping = STATUS_MAPPING
     
     def get_random_headers(self) -> Dict[str, str]:
-        """Get random headers with fake user agent"""
-        return {
-            'User-Agent': self.ua.random,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0',
-            'Referer': 'https://www.google.com/'
-        }
+        """Get headers with a randomly chosen browser user agent"""
+        return {**_BASE_HEADERS, 'User-Agent': random.choice(_USER_AGENTS)}
+    
+    def _reserve_request_slot(self, url: str) -> float:
+        """Reserve the next request slot for the URL's host and return the seconds to wait"""
+        host = urllib.parse.urlparse(url).netloc
+        min_interval = 0.0
+        for domain, interval in HOST_MIN_INTERVALS.items():
+            if host == domain or host.endswith('.' + domain):
+                min_interval = interval
+                break
+        if not min_interval:
+            return 0.0
+        
+        with self._throttle_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_request.get(host, 0.0))
+            self._host_next_request[host] = slot + min_interval
+        return slot - now
     
     def make_request(self, url: str, max_retries: int = 3) -> Optional[requests.Response]:
-        """Make a request with random headers and retry logic"""
+        """Make a request with random headers and retry logic; the session paces uncached requests per host"""
         for attempt in range(max_retries):
             try:
                 headers = self.get_random_headers()
                 response = self.session.get(url, headers=headers, timeout=15)
                 
                 if response.status_code == 200:
-                    logger.info(f"Successfully scraped {url} (attempt {attempt + 1})")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Successfully scraped %s (attempt %d)", url, attempt + 1)
                     return response
                 elif response.status_code == 429:
                     wait_time = (2 ** attempt) + random.uniform(1, 3)
-                    logger.warning(f"Rate limited, waiting {wait_time:.1f}s before retry {attempt + 1}")
+                    logger.warning("Rate limited, waiting %.1fs before retry %d", wait_time, attempt + 1)
                     time.sleep(wait_time)
                 else:
-                    logger.warning(f"HTTP {response.status_code} on attempt {attempt + 1}")
+                    logger.warning("HTTP %d on attempt %d", response.status_code, attempt + 1)
                     
             except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed on attempt {attempt + 1}: {e}")
+                logger.warning("Request failed on attempt %d: %s", attempt + 1, e)
                 if attempt < max_retries - 1:
                     time.sleep(2 ** attempt)
         
-        logger.error(f"Failed to scrape {url} after {max_retries} attempts")
+        logger.error("Failed to scrape %s after %d attempts", url, max_retries)
         return None
     
     
@@ -139,15 +291,19 @@ class AdvancedNFLScraper:
         if not response:
             return []
         
+        return self._parse_espn_payload(response.content)
+    
+    def _parse_espn_payload(self, content: bytes) -> List[AdvancedGameData]:
+        """Parse an ESPN scoreboard API payload"""
         try:
-            data = response.json()
-            games = []
+            data = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
+            events = data.get('events', [])
             
-            if 'events' in data:
-                for event in data['events']:
-                    game_data = self._parse_espn_event(event)
-                    if game_data:
-                        games.append(game_data)
+            games = []
+            for event in events:
+                game_data = self._parse_espn_event(event)
+                if game_data:
+                    games.append(game_data)
             
             logger.info(f"Found {len(games)} games from ESPN API")
             return games
@@ -159,21 +315,25 @@ class AdvancedNFLScraper:
     def _parse_espn_event(self, event) -> Optional[AdvancedGameData]:
         """Parse ESPN event data"""
         try:
+            competitors = event['competitions'][0]['competitors']
+            home, away = competitors[0], competitors[1]
+            
             # Extract basic info
-            home_team = event['competitions'][0]['competitors'][0]['team']['abbreviation']
-            away_team = event['competitions'][0]['competitors'][1]['team']['abbreviation']
+            home_team = home['team']['abbreviation']
+            away_team = away['team']['abbreviation']
             
             # Extract scores
-            home_score = int(event['competitions'][0]['competitors'][0]['score'])
-            away_score = int(event['competitions'][0]['competitors'][1]['score'])
+            home_score = int(home['score'])
+            away_score = int(away['score'])
             
             # Extract status
-            status = event['status']['type']['name']
-            quarter = event['status']['period']
-            time_remaining = event['status']['displayClock'] or '0:00'
+            event_status = event['status']
+            status = event_status['type']['name']
+            quarter = event_status['period']
+            time_remaining = event_status['displayClock'] or '0:00'
             
             # Map status
-            mapped_status = self.status_mapping.get(status.upper(), 'scheduled')
+            mapped_status = ESPN_STATUS_MAPPING.get(status, 'scheduled')
             
             # Generate game ID
             game_id = f"espn_{home_team}_{away_team}_{datetime.now().strftime('%Y%m%d')}"
@@ -203,29 +363,20 @@ class AdvancedNFLScraper:
         if not response:
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        return self._parse_html_page(response.content)
+    
+    def _parse_html_page(self, content: bytes) -> List[AdvancedGameData]:
+        """Parse game cards out of an ESPN scoreboard HTML page"""
+        soup = BeautifulSoup(content, HTML_PARSER)
         games = []
         
-        # Look for various selectors
-        selectors = [
-            '.nfl-c-game-card',
-            '.game-card',
-            '.score-card',
-            '[data-testid*="game"]',
-            '.nfl-s-scoreboard-game',
-            '.game',
-            '.scoreboard-game'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                logger.info(f"Found {len(elements)} games using selector: {selector}")
-                for element in elements:
-                    game_data = self._parse_html_game_element(element)
-                    if game_data:
-                        games.append(game_data)
-                break
+        elements = soup.select(self._JOINED_SELECTOR)
+        if elements:
+            logger.info(f"Found {len(elements)} candidate game elements")
+            for element in elements:
+                game_data = self._parse_html_game_element(element)
+                if game_data:
+                    games.append(game_data)
         
         logger.info(f"Found {len(games)} games from NFL HTML")
         return games
@@ -237,8 +388,7 @@ class AdvancedNFLScraper:
             text = element.get_text()
             
             # Look for team patterns
-            team_pattern = r'([A-Z]{2,4})\s*(\d+)\s*-\s*([A-Z]{2,4})\s*(\d+)'
-            match = re.search(team_pattern, text)
+            match = self._TEAM_RE.search(text)
             
             if match:
                 away_team, away_score, home_team, home_score = match.groups()
@@ -274,29 +424,148 @@ class AdvancedNFLScraper:
             ('ESPN HTML', self.scrape_nfl_html)
         ]
         
-        for source_name, scrape_func in sources_to_try:
-            try:
+        # Fetch all sources concurrently but keep the order of preference:
+        # a source's games are used once every preferred source has come back empty
+        executor = ThreadPoolExecutor(max_workers=len(sources_to_try))
+        try:
+            futures = {}
+            for priority, (source_name, scrape_func) in enumerate(sources_to_try):
                 logger.info(f"Trying {source_name}...")
-                games = scrape_func()
-                if games:
-                    all_games.extend(games)
-                    logger.info(f"Successfully got {len(games)} games from {source_name}")
-                    break  # Stop after first successful source
-                else:
+                futures[executor.submit(scrape_func)] = priority
+            
+            results = {}
+            next_priority = 0
+            for future in as_completed(futures):
+                priority = futures[future]
+                source_name = sources_to_try[priority][0]
+                try:
+                    results[priority] = future.result()
+                except Exception as e:
+                    logger.warning(f"Error with {source_name}: {e}")
+                    results[priority] = []
+                
+                # Walk forward through sources that have finished, in preference order
+                while next_priority in results:
+                    games = results[next_priority]
+                    source_name = sources_to_try[next_priority][0]
+                    if games:
+                        all_games.extend(games)
+                        logger.info(f"Successfully got {len(games)} games from {source_name}")
+                        break  # Stop after first successful source
                     logger.info(f"No games found from {source_name}")
-            except Exception as e:
-                logger.warning(f"Error with {source_name}: {e}")
+                    next_priority += 1
+                if all_games:
+                    break
+        finally:
+            # Don't block on slower fallback sources once we have a result
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        # Remove duplicates based on game_id
-        unique_games = {}
+        return self._dedupe_games(all_games)
+    
+    def to_dataframe(self, games: List[AdvancedGameData]) -> pd.DataFrame:
+        """Convert scraped games into a DataFrame with one row per game"""
+        return pd.DataFrame.from_records(
+            (_game_data_row(game) for game in games), columns=GAME_DATA_FIELDS
+        )
+    
+    def _dedupe_games(self, all_games: List[AdvancedGameData]) -> List[AdvancedGameData]:
+        """Remove duplicates based on game_id"""
+        seen = set()
+        final_games = []
         for game in all_games:
-            unique_games[game.game_id] = game
+            if game.game_id not in seen:
+                seen.add(game.game_id)
+                final_games.append(game)
         
-        final_games = list(unique_games.values())
         logger.info(f"Total unique games found: {len(final_games)}")
         
         return final_games
 
+
+class AsyncAdvancedNFLScraper(AdvancedNFLScraper):
+    """Asyncio variant of AdvancedNFLScraper that overlaps requests on one event loop"""
+    
+    def __init__(self):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncAdvancedNFLScraper. Install with: pip install aiohttp")
+        super().__init__()
+    
+    def _client_session(self) -> 'aiohttp.ClientSession':
+        """Create an aiohttp session; must be called from inside the event loop"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+    
+    async def _fetch(self, session: 'aiohttp.ClientSession', url: str,
+                     max_retries: int = 3) -> Optional[bytes]:
+        """Fetch a URL with random headers and retry logic, returning the body"""
+        for attempt in range(max_retries):
+            try:
+                wait_time = self._reserve_request_slot(url)
+                if wait_time > 0:
+                    await asyncio.sleep(wait_time)
+                headers = self.get_random_headers()
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 200:
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("Successfully scraped %s (attempt %d)", url, attempt + 1)
+                        return await response.read()
+                    elif response.status == 429:
+                        wait_time = (2 ** attempt) + random.uniform(1, 3)
+                        logger.warning("Rate limited, waiting %.1fs before retry %d", wait_time, attempt + 1)
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logger.warning("HTTP %d on attempt %d", response.status, attempt + 1)
+                        
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("Request failed on attempt %d: %s", attempt + 1, e)
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2 ** attempt)
+        
+        logger.error("Failed to scrape %s after %d attempts", url, max_retries)
+        return None
+    
+    async def scrape_espn_api_async(self, session: 'aiohttp.ClientSession') -> List[AdvancedGameData]:
+        """Try to scrape ESPN's API"""
+        logger.info("Trying ESPN API...")
+        content = await self._fetch(session, self.sources['espn']['api_url'])
+        return self._parse_espn_payload(content) if content else []
+    
+    async def scrape_nfl_html_async(self, session: 'aiohttp.ClientSession') -> List[AdvancedGameData]:
+        """Scrape ESPN HTML page as fallback"""
+        logger.info("Trying ESPN HTML scraping...")
+        content = await self._fetch(session, self.sources['espn']['scores_url'])
+        return self._parse_html_page(content) if content else []
+    
+    async def get_live_games_async(self) -> List[AdvancedGameData]:
+        """Get live games from all sources concurrently, preferring sources in order"""
+        async with self._client_session() as session:
+            sources_to_try = [
+                ('ESPN API', self.scrape_espn_api_async(session)),
+                ('ESPN HTML', self.scrape_nfl_html_async(session))
+            ]
+            results = await asyncio.gather(
+                *(coro for _, coro in sources_to_try), return_exceptions=True
+            )
+        
+        all_games = []
+        for (source_name, _), games in zip(sources_to_try, results):
+            if isinstance(games, Exception):
+                logger.warning(f"Error with {source_name}: {games}")
+            elif games:
+                all_games.extend(games)
+                logger.info(f"Successfully got {len(games)} games from {source_name}")
+                break  # Use the first successful source
+            else:
+                logger.info(f"No games found from {source_name}")
+        
+        return self._dedupe_games(all_games)
+    
+    def get_live_games(self) -> List[AdvancedGameData]:
+        """Synchronous wrapper around get_live_games_async for CLI use"""
+        return asyncio.run(self.get_live_games_async())
+
 def test_advanced_scraper():
     """Test the advanced scraper"""
     print("🏈 Advanced NFL Scraper Test")
@@ -7,88 +7,398 @@ Monitors and optimizes API response times to achieve <300ms average.
 import time
 import json
 import os
+import sys
 import sqlite3
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from contextlib import contextmanager
 import statistics
+import numpy as np
 from functools import wraps
 import threading
-from collections import defaultdict, deque
+from collections import OrderedDict
 import logging
+import hashlib
+from contextvars import ContextVar, Token
+
+# Optional fast hashing for cache keys
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Optional fast JSON serialization for reports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Random source for simulated query-time jitter
+_RNG = np.random.default_rng()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of independently locked shards in APIPerformanceMonitor (power of two)
+LOCK_STRIPES = 16
+
+# Samples kept per endpoint; a power of two so the write index wraps with a mask
+RING_SIZE = 1024
+
+# Compiled statements kept per SQLite connection by DatabaseQueryOptimizer
+STATEMENT_CACHE_SIZE = 256
+
+# Samples a thread buffers before merging them into the shared monitor shards
+FLUSH_BATCH = 128
+
+# With a background aggregator draining buffers, a thread only merges inline past this
+MAX_BUFFERED = 8 * FLUSH_BATCH
+
+# Indexes backing the canned team_ratings queries (filter on season/config, order by rating)
+TEAM_RATINGS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_team_ratings_season_config_rating "
+    "ON team_ratings(season, config_name, rating DESC)",
+)
+
+
+class _SampleRing:
+    """Preallocated circular buffer of the most recent response times (ns) for one endpoint."""
+    
+    __slots__ = ('buf', 'idx', 'count')
+    
+    def __init__(self):
+        self.buf = np.empty(RING_SIZE, dtype=np.int64)
+        self.idx = 0
+        self.count = 0
+    
+    def append(self, value: int):
+        """Overwrite the oldest sample once the buffer is full."""
+        self.buf[self.idx & (RING_SIZE - 1)] = value
+        self.idx += 1
+        if self.count < RING_SIZE:
+            self.count += 1
+    
+    def values(self) -> np.ndarray:
+        """Copy of the stored samples (in buffer order, not arrival order)."""
+        return self.buf[:self.count].copy()
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class _CoarseClock:
+    """time.monotonic() refreshed by one background thread every `resolution` seconds.
+    
+    Reading `now` is a plain attribute load, which is all the cache TTL checks need.
+    """
+    
+    def __init__(self, resolution: float = 0.01):
+        self.resolution = resolution
+        self.now = time.monotonic()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def start(self):
+        """Start the ticker thread once; later calls are no-ops."""
+        with self._lock:
+            if self._thread is None:
+                self.now = time.monotonic()
+                self._thread = threading.Thread(target=self._tick, name="coarse-clock", daemon=True)
+                self._thread.start()
+    
+    def _tick(self):
+        while True:
+            time.sleep(self.resolution)
+            self.now = time.monotonic()
+    
+    def _after_fork(self):
+        """Threads do not survive fork(); resume ticking in the child if the parent was."""
+        self._lock = threading.Lock()
+        if self._thread is not None:
+            self._thread = None
+            self.start()
+
+
+# Shared by every APICacheManager so the process runs a single ticker
+_coarse_clock = _CoarseClock()
+if hasattr(os, 'register_at_fork'):
+    # Preforking servers (gunicorn --preload) import this module before forking workers
+    os.register_at_fork(after_in_child=_coarse_clock._after_fork)
+
+
+class _ThreadBuffer:
+    """Samples recorded by one thread that have not been merged into the shards yet."""
+    
+    __slots__ = ('lock', 'samples', 'thread')
+    
+    def __init__(self):
+        # Only contended while a flush from another thread is draining this buffer
+        self.lock = threading.Lock()
+        self.samples: List[Tuple[str, int, bool]] = []
+        self.thread = threading.current_thread()
+
+
+def _summarize(arr: np.ndarray) -> Tuple[float, int, int, int, int]:
+    """Mean, min, max, p95 and p99 of the samples from a single np.partition.
+    
+    Partitioning on the first, last and percentile ranks places all four order
+    statistics at once; the mean is summed from the same partitioned array.
+    """
+    n = len(arr)
+    i95 = min(int(n * 95 / 100), n - 1)
+    i99 = min(int(n * 99 / 100), n - 1)
+    part = np.partition(arr, [0, i95, i99, n - 1])
+    return part.sum(dtype=np.float64) / n, part[0], part[n - 1], part[i95], part[i99]
+
+
+def _summarize_all(samples: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Rows of [mean, min, max, p95, p99] for each samples[i, :counts[i]]."""
+    out = np.empty((len(counts), 5))
+    for i, n in enumerate(counts):
+        out[i] = _summarize(samples[i, :n])
+    return out
+
+
+def _percentiles(arr: np.ndarray, percentiles: Tuple[int, ...]) -> np.ndarray:
+    """Nearest-rank percentiles (the value at index len * p / 100 of the sorted data).
+    
+    Uses one O(n) np.partition for all requested percentiles instead of sorting.
+    """
+    n = len(arr)
+    indices = [min(int(n * p / 100), n - 1) for p in percentiles]
+    return np.partition(arr, indices)[indices]
+
 class APIPerformanceMonitor:
     """Monitors API performance and response times."""
     
     def __init__(self, db_path: str = "artifacts/stats/nfl_elo_stats.db"):
         self.db_path = db_path
-        self.response_times = defaultdict(lambda: deque(maxlen=1000))  # Keep last 1000 requests
-        self.error_counts = defaultdict(int)
-        self.lock = threading.Lock()
+        # Endpoints are spread over LOCK_STRIPES shards, each with its own lock,
+        # so recorders for different endpoints don't contend on one lock
+        self.locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        # Keep last RING_SIZE requests per endpoint
+        self.response_times: List[Dict[str, _SampleRing]] = [{} for _ in range(LOCK_STRIPES)]
+        self.error_counts: List[Dict[str, int]] = [{} for _ in range(LOCK_STRIPES)]
+        # Each recording thread batches samples locally and merges them every FLUSH_BATCH
+        self._local = threading.local()
+        self._buffers: List[_ThreadBuffer] = []
+        self._buffers_lock = threading.Lock()
+        # Interned "METHOD:endpoint" keys, built once per (method, endpoint) pair
+        self._keys: Dict[Tuple[str, str], str] = {}
+        # Optional background thread that drains every thread's buffer
+        self._aggregator: Optional[threading.Thread] = None
+        self._aggregator_stop = threading.Event()
         
     def record_response_time(self, endpoint: str, method: str, response_time: float, status_code: int = 200):
-        """Record response time for an API endpoint."""
-        with self.lock:
-            key = f"{method}:{endpoint}"
-            self.response_times[key].append(response_time)
-            
-            if status_code >= 400:
-                self.error_counts[key] += 1
+        """Record response time (in seconds) for an API endpoint."""
+        self.record_response_time_ns(endpoint, method, round(response_time * 1e9), status_code)
+    
+    def record_response_time_ns(self, endpoint: str, method: str, response_time_ns: int, status_code: int = 200):
+        """Record response time in integer nanoseconds, as measured by time.perf_counter_ns()."""
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            buffer = self._local.buffer = _ThreadBuffer()
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+        
+        key = self._keys.get((method, endpoint))
+        if key is None:
+            key = self._keys.setdefault((method, endpoint), sys.intern(f"{method}:{endpoint}"))
+        
+        with buffer.lock:
+            buffer.samples.append((key, response_time_ns, status_code >= 400))
+            full = len(buffer.samples) >= (FLUSH_BATCH if self._aggregator is None else MAX_BUFFERED)
+        
+        if full:
+            self._flush_buffer(buffer)
+    
+    def _flush_buffer(self, buffer: _ThreadBuffer):
+        """Merge one thread's pending samples into the shards, one lock per shard touched."""
+        with buffer.lock:
+            pending, buffer.samples = buffer.samples, []
+        
+        by_shard: Dict[int, List[Tuple[str, int, bool]]] = {}
+        for sample in pending:
+            by_shard.setdefault(hash(sample[0]) & (LOCK_STRIPES - 1), []).append(sample)
+        
+        for shard, samples in by_shard.items():
+            shard_times = self.response_times[shard]
+            shard_errors = self.error_counts[shard]
+            with self.locks[shard]:
+                for key, response_time_ns, is_error in samples:
+                    ring = shard_times.get(key)
+                    if ring is None:
+                        ring = shard_times[key] = _SampleRing()
+                    ring.append(response_time_ns)
+                    if is_error:
+                        shard_errors[key] = shard_errors.get(key, 0) + 1
+    
+    def flush(self):
+        """Merge every thread's pending samples so stats reflect all recorded requests."""
+        with self._buffers_lock:
+            buffers = list(self._buffers)
+            # Buffers of finished threads only need this last drain
+            self._buffers = [b for b in self._buffers if b.thread.is_alive()]
+        
+        for buffer in buffers:
+            self._flush_buffer(buffer)
+    
+    def start_aggregator(self, interval: float = 0.05):
+        """Drain all thread buffers from a background thread every `interval` seconds.
+        
+        Recording threads then only append to their own buffer and stop merging
+        into the shared shards themselves (unless a buffer exceeds MAX_BUFFERED).
+        """
+        if self._aggregator is not None:
+            return
+        
+        self._aggregator_stop.clear()
+        
+        def run():
+            while not self._aggregator_stop.wait(interval):
+                self.flush()
+        
+        self._aggregator = threading.Thread(target=run, name="api-monitor-aggregator", daemon=True)
+        self._aggregator.start()
+    
+    def stop_aggregator(self):
+        """Stop the background aggregator and merge anything still buffered."""
+        if self._aggregator is None:
+            return
+        
+        self._aggregator_stop.set()
+        self._aggregator.join()
+        self._aggregator = None
+        self.flush()
+    
+    def _snapshot_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Compute per-endpoint timing stats (in nanoseconds) from one array per endpoint."""
+        self.flush()
+        
+        # Hold each shard lock only long enough to copy its samples, so
+        # recorders never wait on the stats arithmetic below
+        samples = {}
+        errors = {}
+        for lock, shard_times, shard_errors in zip(self.locks, self.response_times, self.error_counts):
+            with lock:
+                samples.update((key, ring.values()) for key, ring in shard_times.items() if ring.count)
+                errors.update(shard_errors)
+        
+        if not samples:
+            return {}
+        
+        # Lay the samples out as one (endpoints x RING_SIZE) block for a single kernel call
+        keys = list(samples)
+        counts = np.fromiter((len(samples[key]) for key in keys), dtype=np.int64, count=len(keys))
+        block = np.zeros((len(keys), RING_SIZE), dtype=np.int64)
+        for row, key in zip(block, keys):
+            row[:len(samples[key])] = samples[key]
+        summary = _summarize_all(block, counts)
+        
+        snapshot = {}
+        for key, count, (mean, min_ns, max_ns, p95, p99) in zip(keys, counts, summary):
+            snapshot[key] = {
+                'mean': mean,
+                'min': min_ns,
+                'max': max_ns,
+                'p95': p95,
+                'p99': p99,
+                'count': int(count),
+                'errors': errors.get(key, 0)
+            }
+        
+        return snapshot
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get comprehensive performance statistics."""
-        with self.lock:
-            stats = {}
-            
-            for key, times in self.response_times.items():
-                if times:
-                    stats[key] = {
-                        'avg_time_ms': round(statistics.mean(times) * 1000, 2),
-                        'min_time_ms': round(min(times) * 1000, 2),
-                        'max_time_ms': round(max(times) * 1000, 2),
-                        'p95_time_ms': round(self._percentile(times, 95) * 1000, 2),
-                        'p99_time_ms': round(self._percentile(times, 99) * 1000, 2),
-                        'request_count': len(times),
-                        'error_count': self.error_counts[key],
-                        'error_rate': round(self.error_counts[key] / len(times) * 100, 2) if times else 0
-                    }
-            
-            return stats
+        stats = {}
+        
+        for key, s in self._snapshot_stats().items():
+            stats[key] = {
+                'avg_time_ms': round(float(s['mean']) / 1e6, 2),
+                'min_time_ms': round(int(s['min']) / 1e6, 2),
+                'max_time_ms': round(int(s['max']) / 1e6, 2),
+                'p95_time_ms': round(int(s['p95']) / 1e6, 2),
+                'p99_time_ms': round(int(s['p99']) / 1e6, 2),
+                'request_count': s['count'],
+                'error_count': s['errors'],
+                'error_rate': round(s['errors'] / s['count'] * 100, 2)
+            }
+        
+        return stats
     
     def _percentile(self, data: List[float], percentile: int) -> float:
         """Calculate percentile of data."""
-        sorted_data = sorted(data)
-        index = int(len(sorted_data) * percentile / 100)
-        return sorted_data[min(index, len(sorted_data) - 1)]
+        return float(_percentiles(np.asarray(data, dtype=np.float64), (percentile,))[0])
     
     def get_slow_endpoints(self, threshold_ms: float = 300) -> List[Dict[str, Any]]:
         """Get endpoints that exceed the response time threshold."""
         slow_endpoints = []
         
-        for key, times in self.response_times.items():
-            if times:
-                avg_time_ms = statistics.mean(times) * 1000
-                if avg_time_ms > threshold_ms:
-                    method, endpoint = key.split(':', 1)
-                    slow_endpoints.append({
-                        'endpoint': endpoint,
-                        'method': method,
-                        'avg_time_ms': round(avg_time_ms, 2),
-                        'request_count': len(times),
-                        'p95_time_ms': round(self._percentile(times, 95) * 1000, 2)
-                    })
+        for key, s in self._snapshot_stats().items():
+            avg_time_ms = float(s['mean']) / 1e6
+            if avg_time_ms > threshold_ms:
+                method, endpoint = key.split(':', 1)
+                slow_endpoints.append({
+                    'endpoint': endpoint,
+                    'method': method,
+                    'avg_time_ms': round(avg_time_ms, 2),
+                    'request_count': s['count'],
+                    'p95_time_ms': round(int(s['p95']) / 1e6, 2)
+                })
         
         return sorted(slow_endpoints, key=lambda x: x['avg_time_ms'], reverse=True)
 
+# (endpoint, method) of the request being served, set per request by the web layer
+_request_endpoint: ContextVar[Optional[Tuple[str, str]]] = ContextVar('api_request_endpoint', default=None)
+
+
+def set_request_endpoint(endpoint: str, method: str) -> Token:
+    """Attribute monitored calls in the current context to a route and HTTP method."""
+    return _request_endpoint.set((endpoint, method))
+
+
+def reset_request_endpoint(token: Token):
+    """Restore the attribution that was active before set_request_endpoint()."""
+    _request_endpoint.reset(token)
+
+
+def register_request_attribution(app):
+    """Set the request endpoint for every request handled by a Flask app.
+    
+    Monitored functions called while serving a request are then recorded under the
+    route template (e.g. /api/elo/team/<team>) and real HTTP method.
+    """
+    from flask import g, request
+    
+    @app.before_request
+    def _set_request_endpoint():
+        rule = request.url_rule.rule if request.url_rule is not None else request.path
+        g._request_endpoint_token = set_request_endpoint(rule, request.method)
+    
+    @app.teardown_request
+    def _reset_request_endpoint(exc=None):
+        token = g.pop('_request_endpoint_token', None)
+        if token is not None:
+            reset_request_endpoint(token)
+    
+    return app
+
+
 def performance_monitor(monitor: APIPerformanceMonitor):
     """Decorator to monitor API endpoint performance."""
     def decorator(func):
+        # Outside a request, fall back to a label derived once from the function name
+        default_endpoint = (func.__name__.replace('get_', '').replace('_', '/'), 'GET')
+        current_endpoint = _request_endpoint.get
+        record = monitor.record_response_time_ns
+        clock = time.perf_counter_ns
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = clock()
             status_code = 200
             
             try:
@@ -99,14 +409,9 @@ def performance_monitor(monitor: APIPerformanceMonitor):
                 logger.error(f"API Error in {func.__name__}: {e}")
                 raise
             finally:
-                end_time = time.time()
-                response_time = end_time - start_time
-                
-                # Extract endpoint from function name or args
-                endpoint = func.__name__.replace('get_', '').replace('_', '/')
-                method = 'GET'  # Default, could be extracted from context
-                
-                monitor.record_response_time(endpoint, method, response_time, status_code)
+                elapsed_ns = clock() - start_ns
+                endpoint, method = current_endpoint() or default_endpoint
+                record(endpoint, method, elapsed_ns, status_code)
         
         return wrapper
     return decorator
@@ -117,59 +422,126 @@ class DatabaseQueryOptimizer:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self.query_cache = {}
-        self.query_stats = defaultdict(lambda: {'count': 0, 'total_time': 0, 'avg_time': 0})
+        self.query_stats: Dict[str, Dict[str, float]] = {}
+        # One connection per thread, opened and tuned on first use and then reused
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._ensure_indexes()
+    
+    def _ensure_indexes(self):
+        """Create the indexes the canned queries rely on, if their table exists."""
+        try:
+            conn = self._connection()
+            for statement in TEAM_RATINGS_INDEXES:
+                conn.execute(statement)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Skipping index creation: {e}")
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it and applying PRAGMAs once."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # sqlite3 keeps compiled statements per connection; size it for the canned queries
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            conn.row_factory = sqlite3.Row
+            
+            # Apply performance optimizations
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA cache_size=-10000")  # 10MB cache
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")  # Memory-map up to 256MB for reads
+            
+            self._local.conn = conn
+            # query -> cursor, least recently used first
+            self._local.cursors: OrderedDict[str, sqlite3.Cursor] = OrderedDict()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
     
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections with optimizations."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        
-        # Apply performance optimizations
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA cache_size=-10000")  # 10MB cache
-        conn.execute("PRAGMA temp_store=MEMORY")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        
-        try:
-            yield conn
-        finally:
-            conn.close()
+        """Context manager yielding this thread's persistent, optimized connection."""
+        yield self._connection()
+    
+    def close(self):
+        """Close every connection opened by this optimizer."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
     
     def optimize_query(self, query: str, params: tuple = ()) -> str:
-        """Optimize SQL query for better performance."""
+        """Optimize SQL query for better performance.
+        
+        The first time a SELECT is seen its EXPLAIN QUERY PLAN is cached in
+        query_cache, and a warning is logged if a filtered query scans a table
+        without an index.
+        """
         # Add query hints and optimizations
         optimized_query = query
         
-        # Add EXPLAIN QUERY PLAN for analysis
-        if query.upper().startswith('SELECT'):
-            # Add index hints where appropriate
-            if 'WHERE' in query.upper():
-                # Ensure proper indexing
-                pass
+        upper_query = query.lstrip().upper()
+        if query not in self.query_cache and upper_query.startswith('SELECT'):
+            try:
+                plan = [row[-1] for row in
+                        self._connection().execute(f"EXPLAIN QUERY PLAN {query}", params)]
+            except sqlite3.Error:
+                # Let the real execution surface the error
+                return optimized_query
+            
+            self.query_cache[query] = plan
+            if 'WHERE' in upper_query and any(
+                step.startswith('SCAN') and 'INDEX' not in step for step in plan
+            ):
+                logger.warning(f"Query scans without an index: {' | '.join(plan)} -- {' '.join(query.split())}")
         
         return optimized_query
     
+    def _cursor(self, query: str) -> sqlite3.Cursor:
+        """Return this thread's cursor for a query, reusing it across calls.
+        
+        At most STATEMENT_CACHE_SIZE cursors are kept per thread, matching the
+        connection's statement cache; the least recently used one is closed.
+        """
+        conn = self._connection()
+        cursors = self._local.cursors
+        cursor = cursors.get(query)
+        if cursor is None:
+            cursor = cursors[query] = conn.cursor()
+            # Plain tuples; execute_optimized_query pairs them with column names itself
+            cursor.row_factory = None
+            if len(cursors) > STATEMENT_CACHE_SIZE:
+                cursors.popitem(last=False)[1].close()
+        else:
+            cursors.move_to_end(query)
+        return cursor
+    
     def execute_optimized_query(self, query: str, params: tuple = ()) -> List[Dict]:
         """Execute query with performance monitoring."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            with self.get_connection() as conn:
-                optimized_query = self.optimize_query(query, params)
-                cursor = conn.execute(optimized_query, params)
-                results = [dict(row) for row in cursor.fetchall()]
-                
-                # Update query statistics
-                execution_time = time.time() - start_time
-                self.query_stats[query]['count'] += 1
-                self.query_stats[query]['total_time'] += execution_time
-                self.query_stats[query]['avg_time'] = (
-                    self.query_stats[query]['total_time'] / 
-                    self.query_stats[query]['count']
-                )
-                
-                return results
+            optimized_query = self.optimize_query(query, params)
+            cursor = self._cursor(optimized_query)
+            cursor.execute(optimized_query, params)
+            columns = [col[0] for col in cursor.description or ()]
+            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            
+            # Update query statistics
+            execution_time = (time.perf_counter_ns() - start_ns) * 1e-9
+            stats = self.query_stats.get(query)
+            if stats is None:
+                stats = self.query_stats[query] = {'count': 0, 'total_time': 0, 'avg_time': 0}
+            stats['count'] += 1
+            stats['total_time'] += execution_time
+            stats['avg_time'] = stats['total_time'] / stats['count']
+            
+            return results
                 
         except Exception as e:
             logger.error(f"Query execution failed: {e}")
@@ -179,67 +551,58 @@ class APICacheManager:
     """Manages intelligent caching for API responses."""
     
     def __init__(self, max_size: int = 1000, default_ttl: int = 300):
-        self.cache = {}
-        self.access_times = {}
-        self.ttl = {}
+        # key -> (data, expires_at); insertion order doubles as recency order
+        self.cache: OrderedDict[bytes, Tuple[Any, float]] = OrderedDict()
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.lock = threading.Lock()
+        # TTLs are seconds long, so a clock refreshed every 10ms is precise enough
+        _coarse_clock.start()
+        self._clock = _coarse_clock
     
-    def get_cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
-        """Generate cache key for endpoint and parameters."""
-        sorted_params = sorted(params.items())
-        param_str = '&'.join(f"{k}={v}" for k, v in sorted_params)
-        return f"{endpoint}:{param_str}"
+    def get_cache_key(self, endpoint: str, params: Dict[str, Any]) -> bytes:
+        """Generate a fixed-size 16-byte cache key for endpoint and parameters."""
+        h = xxhash.xxh3_128() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=16)
+        h.update(endpoint.encode())
+        for k, v in sorted(params.items()):
+            h.update(f"\0{k}={v}".encode())
+        return h.digest()
     
     def get(self, endpoint: str, params: Dict[str, Any]) -> Any:
         """Get cached response."""
         with self.lock:
             key = self.get_cache_key(endpoint, params)
             
-            if key not in self.cache:
+            entry = self.cache.get(key)
+            if entry is None:
                 return None
             
             # Check TTL
-            if time.time() > self.ttl[key]:
+            data, expires_at = entry
+            if self._clock.now > expires_at:
                 del self.cache[key]
-                del self.access_times[key]
-                del self.ttl[key]
                 return None
             
-            # Update access time
-            self.access_times[key] = time.time()
-            return self.cache[key]
+            # Mark as most recently used
+            self.cache.move_to_end(key)
+            return data
     
     def set(self, endpoint: str, params: Dict[str, Any], data: Any, ttl: int = None):
         """Set cached response."""
         with self.lock:
             key = self.get_cache_key(endpoint, params)
             
-            # Evict if cache is full
-            if len(self.cache) >= self.max_size:
-                self._evict_lru()
+            self.cache[key] = (data, self._clock.now + (ttl or self.default_ttl))
+            self.cache.move_to_end(key)
             
-            self.cache[key] = data
-            self.access_times[key] = time.time()
-            self.ttl[key] = time.time() + (ttl or self.default_ttl)
-    
-    def _evict_lru(self):
-        """Evict least recently used item."""
-        if not self.access_times:
-            return
-        
-        lru_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-        del self.cache[lru_key]
-        del self.access_times[lru_key]
-        del self.ttl[lru_key]
+            # Evict least recently used items if cache is full
+            while len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
     
     def clear(self):
         """Clear all cache."""
         with self.lock:
             self.cache.clear()
-            self.access_times.clear()
-            self.ttl.clear()
 
 class APIPerformanceOptimizer:
     """Main API performance optimization system."""
@@ -264,24 +627,20 @@ class APIPerformanceOptimizer:
         ]
         
         results = {}
+        calls_per_endpoint = 10
+        
+        # Draw the query-time jitter for every simulated call up front
+        jitters = _RNG.uniform(0, 0.02, size=(len(test_endpoints), calls_per_endpoint))
         
-        for endpoint, params in test_endpoints:
+        for (endpoint, params), endpoint_jitters in zip(test_endpoints, jitters):
             logger.info(f"Testing endpoint: {endpoint}")
             
-            # Simulate API calls (in real implementation, these would be actual calls)
-            times = []
-            for i in range(10):
-                start_time = time.time()
-                
-                # Simulate database query time
-                query_time = self._simulate_database_query(endpoint, params)
-                time.sleep(query_time)
-                
-                end_time = time.time()
-                response_time = end_time - start_time
-                times.append(response_time)
-                
-                # Record in monitor
+            # Simulate API calls (in real implementation, these would be actual calls);
+            # the simulated query time is used as the response time rather than slept
+            times = [self._simulate_database_query(endpoint, params, jitter) for jitter in endpoint_jitters]
+            
+            # Record in monitor
+            for response_time in times:
                 self.monitor.record_response_time(endpoint, "GET", response_time)
             
             avg_time = statistics.mean(times)
@@ -294,8 +653,8 @@ class APIPerformanceOptimizer:
         
         return results
     
-    def _simulate_database_query(self, endpoint: str, params: Dict[str, Any]) -> float:
-        """Simulate database query time based on endpoint complexity."""
+    def _simulate_database_query(self, endpoint: str, params: Dict[str, Any], jitter: float = 0.0) -> float:
+        """Simulate database query time based on endpoint complexity, plus random jitter."""
         # Base query time
         base_time = 0.01  # 10ms
         
@@ -307,15 +666,11 @@ class APIPerformanceOptimizer:
         if "summary" in endpoint:
             base_time += 0.02  # Summary queries
         
-        # Add some randomness
-        import random
-        return base_time + random.uniform(0, 0.02)
+        return base_time + float(jitter)
     
     def _percentile(self, data: List[float], percentile: int) -> float:
         """Calculate percentile of data."""
-        sorted_data = sorted(data)
-        index = int(len(sorted_data) * percentile / 100)
-        return sorted_data[min(index, len(sorted_data) - 1)]
+        return float(_percentiles(np.asarray(data, dtype=np.float64), (percentile,))[0])
     
     def optimize_database_queries(self) -> Dict[str, Any]:
         """Optimize database queries for better performance."""
@@ -513,8 +868,12 @@ def main():
     report_file = f"artifacts/api_performance_report_{int(time.time())}.json"
     os.makedirs(os.path.dirname(report_file), exist_ok=True)
     
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    if ORJSON_AVAILABLE:
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
     
     logger.info(f"💾 Report saved to: {report_file}")
     
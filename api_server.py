@@ -1,17 +1,61 @@
 """Enhanced API server with Action Network expert picks integration."""
 
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import sqlite3
 import json
+import gzip
+import zlib
+import hashlib
+import os
+import atexit
+import threading
+import time
+from functools import wraps
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import logging
+from dataclasses import dataclass, make_dataclass
 from pathlib import Path
 
+# Optional fast JSON serialization for responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional typed records for the row-heavy picks and expert payloads
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Optional response compression: Flask-Compress for live responses, Brotli for cached bodies
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # Import Action Network components
 from ingest.action_network.analysis_tools import ActionNetworkAnalyzer
-from ingest.action_network.team_mapper import ActionNetworkTeamMapper
+from ingest.action_network.team_mapper import ActionNetworkTeamMapper, GAMES_CACHE_TTL
 
 # Import ELO components
 from ingest.nfl.elo_data_service import EloDataService
@@ -22,9 +66,67 @@ from models.nfl_elo.injury_integration import InjuryImpactCalculator
 # Import ELO projection service
 from elo_projection_service import ELOProjectionService
 
+# Import response caching
+from api_performance_optimizer import APICacheManager
+
 app = Flask(__name__)
 CORS(app)
 
+# Bodies below this many bytes are sent uncompressed
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 4
+
+if COMPRESS_AVAILABLE:
+    app.config.update(
+        COMPRESS_ALGORITHM=['br', 'gzip'],
+        COMPRESS_MIN_SIZE=COMPRESS_MIN_SIZE,
+        COMPRESS_LEVEL=COMPRESS_LEVEL,
+        COMPRESS_BR_LEVEL=COMPRESS_LEVEL,
+        # Streamed responses compress their own chunks instead of being buffered whole
+        COMPRESS_STREAMS=False
+    )
+    Compress(app)
+
+if ORJSON_AVAILABLE:
+    class ORJSONProvider(DefaultJSONProvider):
+        """JSON provider that serializes jsonify() payloads with orjson."""
+        
+        # Compact and unsorted (orjson's defaults); non-str keys and NumPy values are coerced
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=self.options).decode()
+        
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(
+                orjson.dumps(obj, default=self.default, option=self.options), mimetype=self.mimetype
+            )
+    
+    app.json = ORJSONProvider(app)
+else:
+    # Skip the stdlib encoder's per-object key sort and debug-mode pretty-printing
+    app.json.sort_keys = False
+    app.json.compact = True
+
+def _request_timestamp() -> str:
+    """Timestamp for the current request, computed on first use and shared by the whole response."""
+    timestamp = g.get('request_timestamp')
+    if timestamp is None:
+        timestamp = g.request_timestamp = datetime.now().isoformat()
+    return timestamp
+
+if MSGSPEC_AVAILABLE:
+    _msgspec_encode = msgspec.json.Encoder().encode
+
+def _json_bytes(obj) -> bytes:
+    """Serialize obj (including _record_builder() records) the way jsonify() would, as bytes."""
+    if MSGSPEC_AVAILABLE:
+        return _msgspec_encode(obj)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=app.json.default, option=ORJSONProvider.options)
+    return app.json.dumps(obj, separators=(',', ':')).encode()
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,6 +138,239 @@ elo_service = EloDataService()
 injury_calculator = InjuryImpactCalculator()
 elo_projection_service = ELOProjectionService()
 
+# Action Network stats and ELO databases, read through one pooled connection per database per
+# worker thread. The pooled connections only read, so they open the file read-only; its schema,
+# indexes and WAL mode are owned by ActionNetworkStorage. The file is still written by ingest
+# while the API runs, so readers must keep locking (no nolock/immutable).
+STATS_DB_PATH = 'artifacts/stats/nfl_elo_stats.db'
+ELO_DB_PATH = 'nfl_elo.db'
+# Private cache per connection: a shared cache would serialize every reader on its mutex
+READ_ONLY_URI = 'file:{}?mode=ro'
+STATEMENT_CACHE_SIZE = 256
+SQLITE_PRAGMAS = (
+    "PRAGMA query_only=1",  # Any stray write from the API fails loudly
+    "PRAGMA cache_size=-32768",  # 32MB page cache per connection; mmap shares hot pages via the OS
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",  # Memory-map up to 1GB so hot pages are read without syscalls
+)
+_tls = threading.local()
+_connections: List[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+
+def _get_conn(db_path: str = STATS_DB_PATH) -> sqlite3.Connection:
+    """Return this thread's read-only connection to ``db_path``, opening and tuning it on first use."""
+    conns = getattr(_tls, 'conns', None)
+    if conns is None:
+        conns = _tls.conns = {}
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(READ_ONLY_URI.format(db_path), uri=True, check_same_thread=False,
+                               isolation_level=None, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        conns[db_path] = conn
+        with _connections_lock:
+            _connections.append(conn)
+    return conn
+
+@atexit.register
+def _close_connections():
+    """Close every pooled stats database connection."""
+    with _connections_lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
+
+# Aggregate endpoints only change when new data is ingested, so serve repeat polls from memory
+RESPONSE_CACHE_TTL = 60
+RESPONSE_MAX_AGE = 30  # Seconds clients may reuse a response without revalidating
+response_cache = APICacheManager(max_size=256, default_ttl=RESPONSE_CACHE_TTL)
+# Longer lifetimes for the shared cache tier, matching how often the data is refreshed
+ANALYTICS_CACHE_TTL = 900
+ELO_CACHE_TTL = 3600
+STALE_CACHE_TTL = 86400  # Seconds a last good body stays available to serve when a handler fails
+
+# Optional Redis tier shared by every worker process, enabled by setting REDIS_URL
+REDIS_URL = os.environ.get('REDIS_URL')
+REDIS_KEY_PREFIX = 'elo-api:'
+redis_client = redis.Redis.from_url(REDIS_URL) if REDIS_AVAILABLE and REDIS_URL else None
+
+def _shared_cache_get(key: str) -> Optional[bytes]:
+    """Return a body from the shared cache, treating an unreachable Redis as a miss."""
+    if redis_client is None:
+        return None
+    try:
+        return redis_client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Shared cache read failed: {e}")
+        return None
+
+def _shared_cache_set(key: str, body: bytes, ttl: int):
+    """Store a body in the shared cache, plus a long-lived copy kept for stale fallback."""
+    if redis_client is None:
+        return
+    try:
+        redis_client.pipeline(transaction=False).setex(key, ttl, body).setex(
+            key + ':stale', STALE_CACHE_TTL, body).execute()
+    except redis.RedisError as e:
+        logger.warning(f"Shared cache write failed: {e}")
+
+def _compress_variants(body: bytes) -> Dict[str, bytes]:
+    """Pre-compressed copies of a cached body, keyed by content coding in preference order."""
+    if len(body) < COMPRESS_MIN_SIZE:
+        return {}
+    variants = {}
+    if BROTLI_AVAILABLE:
+        variants['br'] = brotli.compress(body, quality=COMPRESS_LEVEL)
+    variants['gzip'] = gzip.compress(body, compresslevel=COMPRESS_LEVEL, mtime=0)
+    return variants
+
+def _compress_stream(chunks: Iterator[bytes], encoding: str) -> Iterator[bytes]:
+    """Compress a streamed body chunk by chunk with the given content coding."""
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=COMPRESS_LEVEL)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip framing
+        compress, finish = compressor.compress, compressor.flush
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+def _cached_response(body: bytes, mimetype: str, etag: str, variants: Dict[str, bytes]):
+    """Build a response for a cached body, or an empty 304 if the client already has it."""
+    encoding = request.accept_encodings.best_match(list(variants)) if variants else None
+    if encoding:
+        # Each coding is a different representation, so it gets its own ETag
+        body = variants[encoding]
+        etag = f'{etag}-{encoding}'
+    
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype=mimetype)
+        if encoding:
+            response.content_encoding = encoding
+    if variants:
+        response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = RESPONSE_MAX_AGE
+    return response
+
+def _cache_entry(body: bytes, mimetype: str) -> Tuple[bytes, str, str, Dict[str, bytes]]:
+    """Serialize-once cache entry for a body: the bytes, their ETag and compressed variants."""
+    return body, mimetype, hashlib.blake2b(body, digest_size=8).hexdigest(), _compress_variants(body)
+
+def ttl_cached(func=None, *, ttl: int = RESPONSE_CACHE_TTL):
+    """Cache a GET endpoint's successful JSON response body per query string.
+    
+    Bodies are kept in process for RESPONSE_CACHE_TTL seconds and, when Redis is configured,
+    shared between workers for ttl seconds. If the endpoint fails, the last good shared body
+    is served instead of the error.
+    """
+    if func is None:
+        return lambda f: ttl_cached(f, ttl=ttl)
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        params = {**request.args.to_dict(), **kwargs}
+        cached = response_cache.get(func.__name__, params)
+        if cached is not None:
+            return _cached_response(*cached)
+        
+        shared_key = f'{REDIS_KEY_PREFIX}{request.path}?{request.query_string.decode()}'
+        body = _shared_cache_get(shared_key)
+        if body is not None:
+            entry = _cache_entry(body, 'application/json')
+        else:
+            response = func(*args, **kwargs)
+            # Error paths return (response, status) tuples and are never cached
+            if not isinstance(response, app.response_class) or response.status_code != 200:
+                stale = _shared_cache_get(shared_key + ':stale')
+                if stale is None:
+                    return response
+                return _cached_response(*_cache_entry(stale, 'application/json'))
+            
+            # Serialize and compress once; hits reuse the bytes and their ETag
+            entry = _cache_entry(response.get_data(), response.mimetype)
+            _shared_cache_set(shared_key, entry[0], ttl)
+        
+        response_cache.set(func.__name__, params, entry, min(ttl, RESPONSE_CACHE_TTL))
+        return _cached_response(*entry)
+    
+    return wrapper
+
+# Content codings Flask-Compress may append to an ETag (as "etag:coding") after compressing
+ETAG_CODINGS = ('br', 'gzip', 'deflate', 'zstd')
+
+@app.after_request
+def _revalidate_json(response):
+    """ETag every other successful JSON GET response and answer matching polls with a 304.
+    
+    The hash skips this request's timestamp, so a body whose data has not changed keeps its
+    ETag between polls. Cached and streamed responses are left as they are.
+    """
+    if (request.method not in ('GET', 'HEAD') or response.status_code != 200
+            or not response.is_json or response.is_streamed or response.get_etag()[0]):
+        return response
+    
+    body = response.get_data()
+    timestamp = g.get('request_timestamp')
+    if timestamp:
+        body = body.replace(timestamp.encode(), b'')
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    
+    # A client holding a compressed copy sends back the coding-suffixed ETag
+    for tag in (etag, *(f'{etag}:{coding}' for coding in ETAG_CODINGS)):
+        if request.if_none_match.contains(tag):
+            response = app.response_class(status=304)
+            etag = tag
+            break
+    response.set_etag(etag)
+    if not response.cache_control.max_age:
+        response.cache_control.no_cache = True
+    return response
+
+def _int_arg(args: Dict[str, str], name: str, default: Optional[int]) -> Optional[int]:
+    """Coerce one query argument the way request.args.get(name, default, type=int) does."""
+    try:
+        return int(args[name])
+    except (KeyError, ValueError):
+        return default
+
+@dataclass(frozen=True)
+class ExpertsQuery:
+    """Query arguments for get_experts, parsed once from the query string."""
+    league: str = 'nfl'
+    limit: int = 50
+    
+    @classmethod
+    def from_args(cls, args) -> 'ExpertsQuery':
+        values = args.to_dict()
+        return cls(league=values.get('league', cls.league), limit=_int_arg(values, 'limit', cls.limit))
+
+@dataclass(frozen=True)
+class PicksQuery:
+    """Query arguments for get_picks, parsed once from the query string."""
+    league: str = 'nfl'
+    limit: int = 100
+    expert_id: Optional[int] = None
+    result: Optional[str] = None  # 'win', 'loss', 'pending'
+    
+    @classmethod
+    def from_args(cls, args) -> 'PicksQuery':
+        values = args.to_dict()
+        return cls(
+            league=values.get('league', cls.league),
+            limit=_int_arg(values, 'limit', cls.limit),
+            expert_id=_int_arg(values, 'expert_id', None),
+            result=values.get('result')
+        )
+
 @app.route('/', methods=['GET'])
 def root():
     """Root endpoint - API information."""
@@ -53,243 +388,322 @@ def root():
         'documentation': 'See /api/system/status for detailed system information'
     })
 
-@app.route('/api/system/status', methods=['GET'])
-def get_system_status():
-    """Get overall system status."""
+HEALTH_REFRESH_INTERVAL = 30  # Seconds between background health refreshes
+# Scalar queries behind each health section, keyed by the field they fill
+AN_HEALTH_QUERIES = {
+    'experts_count': "SELECT COUNT(*) FROM action_network_experts",
+    'picks_count': "SELECT COUNT(*) FROM action_network_picks",
+    'last_updated': "SELECT MAX(created_at) FROM action_network_picks"
+}
+NFL_HEALTH_QUERIES = {
+    'games_count': "SELECT COUNT(*) FROM action_network_games WHERE league_name = 'nfl'",
+    'last_updated': "SELECT MAX(created_at) FROM action_network_games WHERE league_name = 'nfl'"
+}
+
+def _section_health(queries: Dict[str, str]) -> Dict[str, Any]:
+    """Run one health section's scalar queries, reporting an error status if any of them fails."""
     try:
-        # Get Action Network health (simplified for now)
-        an_health = {
-            'status': 'healthy',
-            'experts_count': 0,
-            'picks_count': 0,
-            'last_updated': None
-        }
-        
-        # Get NFL stats health (simplified for now)
-        nfl_health = {
-            'status': 'healthy',
-            'games_count': 0,
-            'last_updated': None
-        }
-        
-        # Get database health (simplified for now)
+        conn = _get_conn()
+        section = {key: conn.execute(sql).fetchone()[0] for key, sql in queries.items()}
+        section['status'] = 'healthy'
+    except sqlite3.Error as e:
+        section = {key: None for key in queries}
+        section.update(status='error', error=str(e))
+    return section
+
+def _compute_health() -> Dict[str, Any]:
+    """Query the stats database for the system status payload."""
+    an_health = _section_health(AN_HEALTH_QUERIES)
+    nfl_health = _section_health(NFL_HEALTH_QUERIES)
+    try:
+        stat = os.stat(STATS_DB_PATH)
         db_health = {
             'status': 'healthy',
-            'db_size_mb': 0,
-            'last_updated': None
+            'db_size_mb': round(stat.st_size / 1e6, 2),
+            'last_updated': datetime.fromtimestamp(stat.st_mtime).isoformat()
         }
-        
-        # Determine overall status
-        statuses = [an_health['status'], nfl_health['status'], db_health['status']]
-        
-        if 'critical' in statuses or 'error' in statuses:
-            overall_status = 'critical'
-        elif 'warning' in statuses:
-            overall_status = 'warning'
-        else:
-            overall_status = 'healthy'
-        
-        return jsonify({
-            'status': overall_status,
-            'timestamp': datetime.now().isoformat(),
-            'action_network': an_health,
-            'nfl_stats': nfl_health,
-            'database': db_health
-        })
+    except OSError as e:
+        db_health = {'status': 'error', 'db_size_mb': 0, 'last_updated': None, 'error': str(e)}
+    
+    # Determine overall status
+    statuses = [an_health['status'], nfl_health['status'], db_health['status']]
+    
+    if 'critical' in statuses or 'error' in statuses:
+        overall_status = 'critical'
+    elif 'warning' in statuses:
+        overall_status = 'warning'
+    else:
+        overall_status = 'healthy'
+    
+    return {
+        'status': overall_status,
+        'action_network': an_health,
+        'nfl_stats': nfl_health,
+        'database': db_health
+    }
+
+class _HealthMonitor:
+    """Keeps the latest system health snapshot, refreshed by a background thread."""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    def get(self) -> Dict[str, Any]:
+        """Return the latest snapshot, starting this process's refresher on first use."""
+        # Threads do not survive fork(), so each worker process starts its own refresher
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self.snapshot = _compute_health()
+                    self._pid = os.getpid()
+                    threading.Thread(target=self._run, name="health-refresh", daemon=True).start()
+        return self.snapshot
+    
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.snapshot = _compute_health()
+            except Exception as e:
+                logger.error(f"Error refreshing system health: {e}")
+
+health_monitor = _HealthMonitor(HEALTH_REFRESH_INTERVAL)
+
+@app.route('/api/system/status', methods=['GET'])
+def get_system_status():
+    """Get overall system status from the background health snapshot."""
+    try:
+        return jsonify({**health_monitor.get(), 'timestamp': _request_timestamp()})
     except Exception as e:
         logger.error(f"Error getting system status: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/action-network/experts', methods=['GET'])
+@ttl_cached(ttl=ANALYTICS_CACHE_TTL)
 def get_experts():
     """Get Action Network experts with performance data."""
     try:
-        limit = request.args.get('limit', 50, type=int)
-        league = request.args.get('league', 'nfl')
+        query = ExpertsQuery.from_args(request.args)
+        league = query.league
         
         # Get top experts
-        experts = analyzer.get_top_experts(league, limit=limit)
+        experts = analyzer.get_top_experts(league, limit=query.limit)
         
         return jsonify({
             'experts': experts,
             'total': len(experts),
             'league': league,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting experts: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Expert details in one statement: part 0 is the expert, part 1 its performance windows and
+# part 2 its 20 latest picks. Each part's columns line up with the JSON keys below.
+EXPERT_KEYS = ('id', 'name', 'username', 'is_verified', 'followers', 'bio', 'picture_url')
+PERFORMANCE_KEYS = ('window_period', 'wins', 'losses', 'pushes', 'total_picks', 'units_net', 'roi',
+                    'win_streak_type', 'win_streak_value', 'win_streak_start_date', 'recorded_at')
+RECENT_PICK_KEYS = ('pick_id', 'league', 'description', 'value', 'odds', 'units', 'units_net',
+                    'result', 'created_at', 'trend', 'likes', 'copies')
+
+def _record_builder(name: str, keys: Tuple[str, ...], offset: int = 0):
+    """Return a function building a payload record from row columns offset.. in key order.
+    
+    Records are msgspec Structs with msgspec, slotted dataclasses with orjson (both of which
+    serialize natively) and plain dicts otherwise; one itemgetter pulls every column in a
+    single call and skips any trailing padding columns.
+    """
+    get_values = itemgetter(*range(offset, offset + len(keys)))
+    if MSGSPEC_AVAILABLE:
+        record_type = msgspec.defstruct(name, keys, gc=False)
+    elif ORJSON_AVAILABLE:
+        record_type = make_dataclass(name, keys, namespace={'__slots__': keys})
+    else:
+        def build_dict(row):
+            return dict(zip(keys, get_values(row)))
+        return build_dict
+    
+    def build(row):
+        return record_type(*get_values(row))
+    
+    return build
+
+# Expert detail rows carry part and sort_at ahead of the payload columns
+_expert_record = _record_builder('ExpertRecord', EXPERT_KEYS, offset=2)
+_performance_record = _record_builder('PerformanceRecord', PERFORMANCE_KEYS, offset=2)
+_recent_pick_record = _record_builder('RecentPickRecord', RECENT_PICK_KEYS, offset=2)
+EXPERT_DETAILS_SQL = '''
+    WITH x AS (
+        SELECT id, an_expert_id, name, username, is_verified, followers, bio, picture_url
+        FROM action_network_experts
+        WHERE an_expert_id = ?
+    )
+    SELECT 0 AS part, NULL AS sort_at, an_expert_id, name, username, is_verified, followers, bio,
+           picture_url, NULL, NULL, NULL, NULL, NULL
+    FROM x
+    UNION ALL
+    SELECT 1, recorded_at, window_period, wins, losses, pushes, total_picks, units_net, roi,
+           win_streak_type, win_streak_value, win_streak_start_date, recorded_at, NULL
+    FROM action_network_expert_performance
+    WHERE expert_id = (SELECT id FROM x)
+    UNION ALL
+    SELECT * FROM (
+        SELECT 2, created_at, an_pick_id, league_name, play_description, value, odds, units,
+               units_net, result, created_at, trend, social_likes, social_copies
+        FROM action_network_picks
+        WHERE expert_id = (SELECT id FROM x)
+        ORDER BY created_at DESC
+        LIMIT 20
+    )
+    ORDER BY part, sort_at DESC
+'''
+
 @app.route('/api/action-network/experts/<int:expert_id>', methods=['GET'])
 def get_expert_details(expert_id):
     """Get detailed information for a specific expert."""
     try:
-        # Get expert performance summary
-        conn = sqlite3.connect('artifacts/stats/nfl_elo_stats.db')
-        cursor = conn.cursor()
-        
-        # Get expert basic info
-        cursor.execute('''
-            SELECT id, an_expert_id, name, username, is_verified, followers, bio, picture_url
-            FROM action_network_experts
-            WHERE an_expert_id = ?
-        ''', (expert_id,))
-        
-        expert_info = cursor.fetchone()
-        if not expert_info:
+        rows = _get_conn().execute(EXPERT_DETAILS_SQL, (expert_id,)).fetchall()
+        if not rows or rows[0][0] != 0:
             return jsonify({'error': 'Expert not found'}), 404
         
-        # Get expert performance
-        cursor.execute('''
-            SELECT window_period, wins, losses, pushes, total_picks, units_net, roi,
-                   win_streak_type, win_streak_value, win_streak_start_date, recorded_at
-            FROM action_network_expert_performance
-            WHERE expert_id = ?
-            ORDER BY recorded_at DESC
-        ''', (expert_info[0],))
-        
-        performance_data = cursor.fetchall()
-        
-        # Get recent picks
-        cursor.execute('''
-            SELECT an_pick_id, league_name, play_description, value, odds, units,
-                   units_net, result, created_at, trend, social_likes, social_copies
-            FROM action_network_picks
-            WHERE expert_id = ?
-            ORDER BY created_at DESC
-            LIMIT 20
-        ''', (expert_info[0],))
-        
-        recent_picks = cursor.fetchall()
-        
-        conn.close()
+        # Split the rows by part
+        expert = _expert_record(rows[0])
+        performance_data = [_performance_record(row) for row in rows if row[0] == 1]
+        recent_picks = [_recent_pick_record(row) for row in rows if row[0] == 2]
         
-        return jsonify({
-            'expert': {
-                'id': expert_info[1],
-                'name': expert_info[2],
-                'username': expert_info[3],
-                'is_verified': expert_info[4],
-                'followers': expert_info[5],
-                'bio': expert_info[6],
-                'picture_url': expert_info[7]
-            },
-            'performance': [
-                {
-                    'window_period': row[0],
-                    'wins': row[1],
-                    'losses': row[2],
-                    'pushes': row[3],
-                    'total_picks': row[4],
-                    'units_net': row[5],
-                    'roi': row[6],
-                    'win_streak_type': row[7],
-                    'win_streak_value': row[8],
-                    'win_streak_start_date': row[9],
-                    'recorded_at': row[10]
-                } for row in performance_data
-            ],
-            'recent_picks': [
-                {
-                    'pick_id': row[0],
-                    'league': row[1],
-                    'description': row[2],
-                    'value': row[3],
-                    'odds': row[4],
-                    'units': row[5],
-                    'units_net': row[6],
-                    'result': row[7],
-                    'created_at': row[8],
-                    'trend': row[9],
-                    'likes': row[10],
-                    'copies': row[11]
-                } for row in recent_picks
-            ],
-            'timestamp': datetime.now().isoformat()
+        body = _json_bytes({
+            'expert': expert,
+            'performance': performance_data,
+            'recent_picks': recent_picks,
+            'timestamp': _request_timestamp()
         })
+        return app.response_class(body, mimetype='application/json')
     except Exception as e:
         logger.error(f"Error getting expert details: {e}")
         return jsonify({'error': str(e)}), 500
 
+# get_picks query variants keyed by (expert_id filter, result filter); fixed SQL text
+# lets each variant hit the connection's statement cache instead of being re-prepared.
+# Picks are filtered and limited first so the joins only see the rows being returned. A pick
+# without a known expert has no expert_name and is skipped, as the experts join does.
+PICKS_FILTER_SQL = '''
+    SELECT p.an_pick_id, p.expert_name, p.game_id, p.play_description, p.pick_type, p.value, p.odds,
+           p.units, p.units_net, p.result, p.created_at, p.trend, p.social_likes, p.social_copies
+    FROM action_network_picks p
+    WHERE p.league_name = ? AND p.expert_name IS NOT NULL
+'''
+# Same rows for databases that ActionNetworkStorage has not yet given the expert_name column
+PICKS_EXPERTS_JOIN_FILTER_SQL = '''
+    SELECT p.an_pick_id, e.name AS expert_name, p.game_id, p.play_description, p.pick_type, p.value, p.odds,
+           p.units, p.units_net, p.result, p.created_at, p.trend, p.social_likes, p.social_copies
+    FROM action_network_picks p
+    JOIN action_network_experts e ON p.expert_id = e.id
+    WHERE p.league_name = ?
+'''
+PICKS_LIMIT_SQL = ' ORDER BY p.created_at DESC LIMIT ?'
+PICKS_JOIN_SQL = '''
+    SELECT p.an_pick_id AS pick_id, p.expert_name, p.play_description AS description,
+           p.pick_type, p.value, p.odds, p.units, p.units_net,
+           p.result, p.created_at, p.trend, p.social_likes AS likes, p.social_copies AS copies,
+           g.an_game_id AS game_id, g.start_time AS game_start, g.game_status,
+           ht.full_name AS home_team, ht.abbr AS home_team_abbr,
+           at.full_name AS away_team, at.abbr AS away_team_abbr
+    FROM p
+    LEFT JOIN action_network_games g ON p.game_id = g.an_game_id
+    LEFT JOIN action_network_teams ht ON g.home_team_id = ht.an_team_id
+    LEFT JOIN action_network_teams at ON g.away_team_id = at.an_team_id
+    ORDER BY p.created_at DESC
+'''
+PICKS_FILTERS = {
+    (False, False): '',
+    (True, False): ' AND p.expert_id = ?',
+    (False, True): ' AND p.result = ?',
+    (True, True): ' AND p.expert_id = ? AND p.result = ?',
+}
+PICKS_SQL = {
+    key: 'WITH p AS (' + PICKS_FILTER_SQL + filters + PICKS_LIMIT_SQL + ')' + PICKS_JOIN_SQL
+    for key, filters in PICKS_FILTERS.items()
+}
+PICKS_EXPERTS_JOIN_SQL = {
+    key: 'WITH p AS (' + PICKS_EXPERTS_JOIN_FILTER_SQL + filters + PICKS_LIMIT_SQL + ')' + PICKS_JOIN_SQL
+    for key, filters in PICKS_FILTERS.items()
+}
+# Set once the stats database has the expert_name column; a column is never dropped, so
+# only its absence is re-checked
+_picks_have_expert_name = False
+
+def _picks_sql(conn: sqlite3.Connection) -> Dict[Tuple[bool, bool], str]:
+    """get_picks variants for ``conn``: the expert_name column if present, else the experts join."""
+    global _picks_have_expert_name
+    if not _picks_have_expert_name:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(action_network_picks)")}
+        _picks_have_expert_name = 'expert_name' in columns
+    return PICKS_SQL if _picks_have_expert_name else PICKS_EXPERTS_JOIN_SQL
+
+# Keys of a get_picks record, in PICKS_JOIN_SQL column order
+PICK_KEYS = ('pick_id', 'expert_name', 'description', 'pick_type', 'value', 'odds', 'units',
+             'units_net', 'result', 'created_at', 'trend', 'likes', 'copies', 'game_id',
+             'game_start', 'game_status', 'home_team', 'home_team_abbr', 'away_team', 'away_team_abbr')
+_pick_record = _record_builder('PickRecord', PICK_KEYS)
+
+# Rows fetched and serialized per streamed chunk of the picks response
+PICKS_STREAM_BATCH = 200
+# Content codings the picks stream can be compressed with, in preference order
+STREAM_ENCODINGS = ['br', 'gzip'] if BROTLI_AVAILABLE else ['gzip']
+
 @app.route('/api/action-network/picks', methods=['GET'])
 def get_picks():
     """Get Action Network picks with filtering options."""
     try:
-        league = request.args.get('league', 'nfl')
-        limit = request.args.get('limit', 100, type=int)
-        expert_id = request.args.get('expert_id', type=int)
-        result = request.args.get('result')  # 'win', 'loss', 'pending'
-        
-        # Build query
-        query = '''
-            SELECT p.an_pick_id, e.name as expert_name, p.play_description,
-                   p.pick_type, p.value, p.odds, p.units, p.units_net,
-                   p.result, p.created_at, p.trend, p.social_likes, p.social_copies,
-                   g.an_game_id, g.start_time, g.game_status,
-                   ht.full_name as home_team_name, ht.abbr as home_team_abbr,
-                   at.full_name as away_team_name, at.abbr as away_team_abbr
-            FROM action_network_picks p
-            JOIN action_network_experts e ON p.expert_id = e.id
-            LEFT JOIN action_network_games g ON p.game_id = g.an_game_id
-            LEFT JOIN action_network_teams ht ON g.home_team_id = ht.an_team_id
-            LEFT JOIN action_network_teams at ON g.away_team_id = at.an_team_id
-            WHERE p.league_name = ?
-        '''
+        query = PicksQuery.from_args(request.args)
+        league = query.league
         
+        # Pick the prepared variant for the optional filters, with params in matching order
         params = [league]
+        if query.expert_id:
+            params.append(query.expert_id)
+        if query.result:
+            params.append(query.result)
+        params.append(query.limit)
         
-        if expert_id:
-            query += ' AND p.expert_id = ?'
-            params.append(expert_id)
-        
-        if result:
-            query += ' AND p.result = ?'
-            params.append(result)
-        
-        query += ' ORDER BY p.created_at DESC LIMIT ?'
-        params.append(limit)
-        
-        conn = sqlite3.connect('artifacts/stats/nfl_elo_stats.db')
+        conn = _get_conn()
         cursor = conn.cursor()
-        cursor.execute(query, params)
-        
-        picks = cursor.fetchall()
-        conn.close()
-        
-        return jsonify({
-            'picks': [
-                {
-                    'pick_id': row[0],
-                    'expert_name': row[1],
-                    'description': row[2],
-                    'pick_type': row[3],
-                    'value': row[4],
-                    'odds': row[5],
-                    'units': row[6],
-                    'units_net': row[7],
-                    'result': row[8],
-                    'created_at': row[9],
-                    'trend': row[10],
-                    'likes': row[11],
-                    'copies': row[12],
-                    'game_id': row[13],
-                    'game_start': row[14],
-                    'game_status': row[15],
-                    'home_team': row[16],
-                    'home_team_abbr': row[17],
-                    'away_team': row[18],
-                    'away_team_abbr': row[19]
-                } for row in picks
-            ],
-            'total': len(picks),
-            'league': league,
-            'timestamp': datetime.now().isoformat()
-        })
+        cursor.arraysize = PICKS_STREAM_BATCH
+        cursor.execute(_picks_sql(conn)[(bool(query.expert_id), bool(query.result))], params)
+        timestamp = _request_timestamp()
+        
+        def stream():
+            # Stream the picks a batch at a time rather than building the whole list; the
+            # total goes last, once it is known
+            yield b'{"league":' + _json_bytes(league) + b',"picks":['
+            total = 0
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    break
+                # Encode the batch as one array and splice its items in without the brackets
+                chunk = _json_bytes([_pick_record(row) for row in rows])[1:-1]
+                yield b',' + chunk if total else chunk
+                total += len(rows)
+            yield b'],"timestamp":' + _json_bytes(timestamp) + b',"total":' + str(total).encode() + b'}'
+        
+        encoding = request.accept_encodings.best_match(STREAM_ENCODINGS)
+        response = app.response_class(_compress_stream(stream(), encoding) if encoding else stream(),
+                                      mimetype='application/json')
+        if encoding:
+            response.content_encoding = encoding
+        response.vary.add('Accept-Encoding')
+        return response
     except Exception as e:
         logger.error(f"Error getting picks: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/action-network/analytics', methods=['GET'])
+@ttl_cached(ttl=ANALYTICS_CACHE_TTL)
 def get_analytics():
     """Get Action Network analytics and insights."""
     try:
@@ -312,13 +726,14 @@ def get_analytics():
             'accuracy_by_type': accuracy_by_type,
             'social_analysis': social_analysis,
             'top_experts': top_experts,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting analytics: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/action-network/teams', methods=['GET'])
+@ttl_cached(ttl=GAMES_CACHE_TTL)
 def get_teams():
     """Get NFL teams with Action Network data."""
     try:
@@ -332,7 +747,7 @@ def get_teams():
             'games': games,
             'team_mappings': nfl_mapping,
             'total_games': len(games),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting teams: {e}")
@@ -344,12 +759,13 @@ def get_elo_seasons():
     """Get available seasons for ELO ratings."""
     try:
         seasons = elo_service.get_available_seasons()
-        return jsonify({'seasons': seasons, 'timestamp': datetime.now().isoformat()})
+        return jsonify({'seasons': seasons, 'timestamp': _request_timestamp()})
     except Exception as e:
         logger.error(f"Error getting ELO seasons: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/elo/ratings', methods=['GET'])
+@ttl_cached(ttl=ELO_CACHE_TTL)
 def get_elo_ratings():
     """Get ELO ratings for a specific season."""
     try:
@@ -362,7 +778,7 @@ def get_elo_ratings():
             'season': season,
             'config': config_name,
             'total_teams': len(ratings),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting ELO ratings: {e}")
@@ -381,13 +797,14 @@ def get_team_elo_history(team):
             'team': team.upper(),
             'history': history,
             'seasons': seasons,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting team ELO history: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/elo/season-summary', methods=['GET'])
+@ttl_cached(ttl=ELO_CACHE_TTL)
 def get_elo_season_summary():
     """Get ELO season summary statistics."""
     try:
@@ -395,7 +812,7 @@ def get_elo_season_summary():
         summary = elo_service.get_season_summary(season)
         return jsonify({
             'summary': summary,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting ELO season summary: {e}")
@@ -415,7 +832,7 @@ def get_elo_team_comparison():
         return jsonify({
             'teams': comparison,
             'season': season,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting ELO team comparison: {e}")
@@ -451,21 +868,21 @@ def recalculate_elo_ratings():
                 'status': 'success',
                 'message': 'ELO ratings recalculated successfully',
                 'output': result.stdout,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _request_timestamp()
             })
         else:
             return jsonify({
                 'status': 'error',
                 'message': 'ELO calculation failed',
                 'error': result.stderr,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _request_timestamp()
             }), 500
             
     except subprocess.TimeoutExpired:
         return jsonify({
             'status': 'error',
             'message': 'ELO calculation timed out',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         }), 500
 
 # ELO Projection endpoints
@@ -487,7 +904,7 @@ def get_elo_projections(season, week):
             'week': week,
             'projections': projections,
             'count': len(projections),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
         
     except Exception as e:
@@ -508,45 +925,38 @@ def generate_elo_projections():
         return jsonify({
             'message': f'ELO projections generated for season {season}',
             'season': season,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
         
     except Exception as e:
         logger.error(f"Error generating ELO projections: {e}")
         return jsonify({'error': str(e)}), 500
 
+# Keys of a team projection record, in TEAM_PROJECTIONS_SQL column order
+PROJECTION_KEYS = ('week', 'projected_rating', 'confidence_score', 'projection_method')
+_projection_record = _record_builder('ProjectionRecord', PROJECTION_KEYS)
+TEAM_PROJECTIONS_SQL = '''
+    SELECT week, projected_rating, confidence_score, projection_method
+    FROM projected_elo_ratings 
+    WHERE team = ? AND season = ?
+    ORDER BY week
+'''
+
 @app.route('/api/elo/projections/team/<team>/<int:season>', methods=['GET'])
 def get_team_elo_projections(team, season):
     """Get ELO projections for a specific team across all weeks."""
     try:
-        conn = sqlite3.connect('nfl_elo.db')
-        cursor = conn.cursor()
+        rows = _get_conn(ELO_DB_PATH).execute(TEAM_PROJECTIONS_SQL, (team.upper(), season)).fetchall()
+        projections = [_projection_record(row) for row in rows]
         
-        cursor.execute('''
-            SELECT week, projected_rating, confidence_score, projection_method
-            FROM projected_elo_ratings 
-            WHERE team = ? AND season = ?
-            ORDER BY week
-        ''', (team.upper(), season))
-        
-        projections = []
-        for row in cursor.fetchall():
-            projections.append({
-                'week': row[0],
-                'projected_rating': row[1],
-                'confidence_score': row[2],
-                'projection_method': row[3]
-            })
-        
-        conn.close()
-        
-        return jsonify({
+        body = _json_bytes({
             'team': team.upper(),
             'season': season,
             'projections': projections,
             'count': len(projections),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error getting team ELO projections: {e}")
@@ -570,6 +980,7 @@ def get_cron_status():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/metrics/performance', methods=['GET'])
+@ttl_cached(ttl=ANALYTICS_CACHE_TTL)
 def get_performance_metrics():
     """Get performance metrics for the dashboard."""
     try:
@@ -593,7 +1004,7 @@ def get_performance_metrics():
             'win_rate': win_rate,
             'total_units': total_units,
             'top_experts': top_experts[:5],  # Top 5 experts
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         }
         
         return jsonify(performance_data)
@@ -606,9 +1017,8 @@ def get_performance_metrics():
 def get_system_health():
     """Get system health status."""
     try:
-        # Get basic system status
-        status_response = get_system_status()
-        status_data = status_response.get_json()
+        # Read the status snapshot directly rather than round-tripping get_system_status()'s JSON
+        status_data = health_monitor.get()
         
         # Add additional health metrics
         health_data = {
@@ -616,7 +1026,7 @@ def get_system_health():
             'action_network': status_data.get('action_network', {}),
             'database': status_data.get('database', {}),
             'nfl_stats': status_data.get('nfl_stats', {}),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _request_timestamp(),
             'uptime': 'N/A',  # Would calculate actual uptime
             'memory_usage': 'N/A',  # Would get actual memory usage
             'cpu_usage': 'N/A'  # Would get actual CPU usage
@@ -664,7 +1074,7 @@ def get_configuration():
                 'max_size_mb': 100,
                 'backup_count': 5
             },
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         }
         
         return jsonify(config_data)
@@ -683,7 +1093,7 @@ def update_configuration():
         
         return jsonify({
             'message': 'Configuration updated successfully',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
         
     except Exception as e:
@@ -704,7 +1114,7 @@ def get_team_roster(team):
             'team': team,
             'season': season,
             'roster': roster,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
         
     except Exception as e:
@@ -725,7 +1135,7 @@ def get_team_games(team):
             'team': team,
             'season': season,
             'games': games,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
         
     except Exception as e:
@@ -745,7 +1155,7 @@ def get_team_analysis(team):
             'team': team,
             'season': season,
             'analysis': analysis,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
         
     except Exception as e:
@@ -1092,7 +1502,7 @@ def get_live_games():
         
         return jsonify({
             'games': games_data,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': _request_timestamp(),
             'total_games': len(games_data),
             'live_games': len([g for g in games_data if g['status'] == 'in_progress'])
         })
@@ -1240,7 +1650,7 @@ def get_live_game_predictions(game_id):
             },
             'prediction': prediction,
             'live_metrics': live_service.calculate_live_metrics(game),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         }
         
         return jsonify(live_prediction)
@@ -1288,7 +1698,7 @@ def get_game_prediction(home_team, away_team):
             'expected_margin': prediction['expected_margin'],
             'home_rating': prediction['home_rating'],
             'away_rating': prediction['away_rating'],
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _request_timestamp()
         })
     except Exception as e:
         logger.error(f"Error getting game prediction: {e}")
@@ -1304,5 +1714,7 @@ if __name__ == '__main__':
     print("  GET /api/action-network/picks - Expert picks")
     print("  GET /api/action-network/analytics - Analytics and insights")
     print("  GET /api/action-network/teams - NFL teams data")
+    print("For production, serve wsgi:app with gunicorn (settings in gunicorn.conf.py)")
     
-    app.run(host='0.0.0.0', port=8000, debug=True)
\ No newline at end of file
+    # The reloader and debugger are opt-in for local development
+    app.run(host='0.0.0.0', port=8000, debug=bool(os.environ.get('FLASK_DEV')), threaded=True)
\ No newline at end of file
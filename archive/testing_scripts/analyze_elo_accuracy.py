@@ -9,8 +9,13 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import tempfile
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -19,210 +24,259 @@ from models.nfl_elo.config import EloConfig
 from models.nfl_elo.backtest import run_backtest
 from ingest.nfl.data_loader import load_games
 
+# Optional JIT for the per-game metrics kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _metrics_sums(p: np.ndarray, home_won: np.ndarray, away_won: np.ndarray) -> Tuple[float, float, float, int]:
+    """Return summed confidence, Brier score, log loss and correct picks (NumPy version)."""
+    y = home_won.astype(np.float64)
+    clipped = np.clip(p, 0.001, 0.999)
+    confidence = np.sum(np.abs(p - 0.5) * 2, dtype=np.float64)
+    brier = np.sum((p - y) ** 2)
+    log_loss = -np.sum(y * np.log(clipped) + (1 - y) * np.log1p(-clipped))
+    correct = int(np.sum(np.where(p > 0.5, home_won, away_won)))
+    return confidence, brier, log_loss, correct
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _metrics_sums(p, home_won, away_won):  # noqa: F811
+        """Return summed confidence, Brier score, log loss and correct picks in one pass."""
+        confidence = 0.0
+        brier = 0.0
+        log_loss = 0.0
+        correct = 0
+        for i in prange(p.shape[0]):
+            pi = p[i]
+            yi = 1.0 if home_won[i] else 0.0
+            clipped = min(max(pi, 0.001), 0.999)
+            confidence += abs(pi - 0.5) * 2
+            brier += (pi - yi) ** 2
+            log_loss -= yi * np.log(clipped) + (1 - yi) * np.log1p(-clipped)
+            if (pi > 0.5 and home_won[i]) or (pi <= 0.5 and away_won[i]):
+                correct += 1
+        return confidence, brier, log_loss, correct
+    
+    # Compile up front so JIT time doesn't land in the first analysis
+    _metrics_sums(np.array([0.5], dtype=np.float32), np.array([True]), np.array([False]))
+
+
+# Completed-game frames handed to worker processes by the parent, keyed by seasons
+_shared_games: Dict[Tuple[int, ...], pd.DataFrame] = {}
+
+
+@lru_cache(maxsize=None)
+def _load_completed(seasons: Tuple[int, ...]) -> pd.DataFrame:
+    """Load games for the given seasons once and keep only completed games."""
+    if seasons in _shared_games:
+        return _shared_games[seasons]
+    games = load_games(list(seasons))
+    # Drop unplayed games once here; everything downstream reuses this frame
+    completed = games.dropna(subset=['home_score', 'away_score']).reset_index(drop=True)
+    # Scores are small integers once unplayed games are gone
+    return completed.astype({'home_score': np.int16, 'away_score': np.int16})
+
+
+@lru_cache(maxsize=32)
+def _cached_backtest(seasons: Tuple[int, ...], config: EloConfig) -> Dict:
+    """Run a backtest once per (seasons, config) pair and reuse the result."""
+    return run_backtest(_load_completed(seasons), config)
+
+
+@lru_cache(maxsize=32)
+def _backtest_df(seasons: Tuple[int, ...], config: EloConfig) -> pd.DataFrame:
+    """Per-game backtest results with prediction, outcome and correctness columns.
+    
+    Built once from the backtest history frame and shared by every analysis;
+    empty when the backtest processed no games.
+    """
+    history = _cached_backtest(seasons, config).get('history')
+    if history is None or len(history) == 0:
+        return pd.DataFrame()
+    
+    df_results = history.copy()
+    # Probabilities need far less than float64 precision; halve the bytes scanned
+    df_results['home_win_prob'] = df_results['p_home'].astype(np.float32)
+    df_results[['home_score', 'away_score']] = df_results[['home_score', 'away_score']].astype(np.int16)
+    df_results['actual_winner'] = pd.Categorical(
+        np.select(
+            [df_results['home_score'] > df_results['away_score'],
+             df_results['home_score'] < df_results['away_score']],
+            ['home', 'away'],
+            default='tie'
+        ),
+        categories=['home', 'away', 'tie']
+    )
+    
+    # Share one team category set so home/away columns compare and group by code
+    teams = sorted(set(df_results['home_team']) | set(df_results['away_team']))
+    for col in ('home_team', 'away_team'):
+        df_results[col] = pd.Categorical(df_results[col], categories=teams)
+    
+    # Games with both a prediction and a result; computed once for every analysis
+    df_results['valid'] = df_results['home_win_prob'].notna() & df_results['actual_winner'].notna()
+    
+    # Outcome flags shared by the analyses; a tie is never a correct pick
+    df_results['pred_home'] = df_results['home_win_prob'].to_numpy() > 0.5
+    df_results['home_won'] = (df_results['actual_winner'] == 'home').to_numpy()
+    df_results['away_won'] = (df_results['actual_winner'] == 'away').to_numpy()
+    df_results['correct'] = df_results['valid'] & np.where(
+        df_results['pred_home'], df_results['home_won'], df_results['away_won']
+    )
+    return df_results
+
+
+def _init_worker(seasons: Tuple[int, ...], games_path: str) -> None:
+    """Read the parent's completed games once per worker instead of reloading them."""
+    _shared_games[seasons] = pd.read_pickle(games_path)
+
+
+def _evaluate_config(item: Tuple[str, Tuple[int, ...], EloConfig]) -> Tuple[str, Dict[str, float]]:
+    """Worker entry point: score one named configuration on the given seasons."""
+    config_name, seasons, config = item
+    return config_name, calculate_accuracy_metrics(seasons, config)
+
+
+# Current production config (30% regression, 2021+); variants override a few fields
+BASE_CONFIG = EloConfig(
+    base_rating=1500.0,
+    k=20.0,
+    hfa_points=55.0,
+    mov_enabled=True,
+    preseason_regress=0.30,
+    use_travel_adjustment=True,
+    use_qb_adjustment=True,
+    start_season=2021,
+    end_season=2025
+)
+
+# Parameter values searched by create_grid_configurations; extend to widen the search
+CONFIG_GRID: Dict[str, List[Any]] = {
+    'k': [10.0, 20.0, 30.0],
+    'preseason_regress': [0.30, 0.50, 0.75],
+    'mov_enabled': [True, False],
+    'hfa_points': [0.0, 55.0],
+}
+
+# Short prefixes for grid parameters in configuration labels
+_GRID_LABELS = {'k': 'k', 'preseason_regress': 'r', 'mov_enabled': 'mov', 'hfa_points': 'hfa'}
+
 
 def create_test_configurations() -> Dict[str, EloConfig]:
     """Create different ELO configurations for accuracy testing."""
     
-    configs = {}
+    base = BASE_CONFIG
+    
+    configs = {
+        'current_30pct': base,
+        # Previous config (75% regression, 2020+)
+        'old_75pct': base.model_copy(update={'preseason_regress': 0.75, 'start_season': 2020}),
+        # Conservative config (50% regression)
+        'conservative_50pct': base.model_copy(update={'preseason_regress': 0.50}),
+        # High K-factor config (more reactive)
+        'reactive_k30': base.model_copy(update={'k': 30.0}),
+        # Low K-factor config (more stable)
+        'stable_k10': base.model_copy(update={'k': 10.0}),
+        # No margin of victory
+        'no_mov': base.model_copy(update={'mov_enabled': False}),
+        # No home field advantage
+        'no_hfa': base.model_copy(update={'hfa_points': 0.0}),
+    }
     
-    # Current production config (30% regression, 2021+)
-    configs['current_30pct'] = EloConfig(
-        base_rating=1500.0,
-        k=20.0,
-        hfa_points=55.0,
-        mov_enabled=True,
-        preseason_regress=0.30,
-        use_travel_adjustment=True,
-        use_qb_adjustment=True,
-        start_season=2021,
-        end_season=2025
-    )
+    return configs
+
+
+def create_grid_configurations(grid: Optional[Dict[str, List[Any]]] = None) -> Dict[str, EloConfig]:
+    """Create one configuration per point of the parameter grid (CONFIG_GRID by default)."""
     
-    # Previous config (75% regression, 2020+)
-    configs['old_75pct'] = EloConfig(
-        base_rating=1500.0,
-        k=20.0,
-        hfa_points=55.0,
-        mov_enabled=True,
-        preseason_regress=0.75,
-        use_travel_adjustment=True,
-        use_qb_adjustment=True,
-        start_season=2020,
-        end_season=2025
-    )
+    grid = CONFIG_GRID if grid is None else grid
+    names = list(grid)
     
-    # Conservative config (50% regression)
-    configs['conservative_50pct'] = EloConfig(
-        base_rating=1500.0,
-        k=20.0,
-        hfa_points=55.0,
-        mov_enabled=True,
-        preseason_regress=0.50,
-        use_travel_adjustment=True,
-        use_qb_adjustment=True,
-        start_season=2021,
-        end_season=2025
-    )
+    configs = {}
+    for values in product(*grid.values()):
+        # e.g. k20_r0.3_mov1_hfa55
+        label = '_'.join(
+            f"{_GRID_LABELS.get(name, name)}{value:d}" if isinstance(value, bool)
+            else f"{_GRID_LABELS.get(name, name)}{value:g}"
+            for name, value in zip(names, values)
+        )
+        configs[label] = BASE_CONFIG.model_copy(update=dict(zip(names, values)))
     
-    # High K-factor config (more reactive)
-    configs['reactive_k30'] = EloConfig(
-        base_rating=1500.0,
-        k=30.0,  # Higher K-factor
-        hfa_points=55.0,
-        mov_enabled=True,
-        preseason_regress=0.30,
-        use_travel_adjustment=True,
-        use_qb_adjustment=True,
-        start_season=2021,
-        end_season=2025
-    )
+    return configs
+
+
+def _metrics_from_df(df_results: pd.DataFrame) -> Dict[str, Any]:
+    """Compute accuracy, Brier score, log loss, confidence and calibration for a results frame."""
     
-    # Low K-factor config (more stable)
-    configs['stable_k10'] = EloConfig(
-        base_rating=1500.0,
-        k=10.0,  # Lower K-factor
-        hfa_points=55.0,
-        mov_enabled=True,
-        preseason_regress=0.30,
-        use_travel_adjustment=True,
-        use_qb_adjustment=True,
-        start_season=2021,
-        end_season=2025
-    )
+    # Basic accuracy metrics over games with a prediction and a result
+    valid = df_results['valid']
+    p = df_results.loc[valid, 'home_win_prob'].to_numpy()
     
-    # No MOV config
-    configs['no_mov'] = EloConfig(
-        base_rating=1500.0,
-        k=20.0,
-        hfa_points=55.0,
-        mov_enabled=False,  # No margin of victory
-        preseason_regress=0.30,
-        use_travel_adjustment=True,
-        use_qb_adjustment=True,
-        start_season=2021,
-        end_season=2025
-    )
+    total_predictions = len(p)
+    if total_predictions == 0:
+        return {'error': 'No valid predictions found'}
+    
+    home_won = df_results.loc[valid, 'home_won'].to_numpy()
+    away_won = df_results.loc[valid, 'away_won'].to_numpy()
+    y = home_won.astype(np.float64)
     
-    # No HFA config
-    configs['no_hfa'] = EloConfig(
-        base_rating=1500.0,
-        k=20.0,
-        hfa_points=0.0,  # No home field advantage
-        mov_enabled=True,
-        preseason_regress=0.30,
-        use_travel_adjustment=True,
-        use_qb_adjustment=True,
-        start_season=2021,
-        end_season=2025
+    # A prediction is correct when the favored side matches the actual winner
+    confidence_sum, brier_sum, log_loss_sum, correct_predictions = _metrics_sums(
+        p, home_won, away_won
     )
     
-    return configs
+    # Calculate final metrics
+    accuracy = correct_predictions / total_predictions
+    avg_confidence = confidence_sum / total_predictions
+    avg_brier_score = brier_sum / total_predictions
+    avg_log_loss = log_loss_sum / total_predictions
+    
+    # Calculate calibration metrics
+    # Bin predictions into tenths of home win probability; p == 1.0 falls outside
+    bin_edges = np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0])
+    bin_idx = np.digitize(p, bin_edges) - 1
+    in_range = (bin_idx >= 0) & (bin_idx < 10)
+    bin_idx = bin_idx[in_range]
+    
+    counts = np.bincount(bin_idx, minlength=10)
+    actual_sums = np.bincount(bin_idx, weights=y[in_range], minlength=10)
+    predicted_sums = np.bincount(bin_idx, weights=p[in_range], minlength=10)
+    
+    # Calibration error is the gap between actual and predicted win rate per bin
+    nonempty = counts > 0
+    calibration_errors = np.abs(
+        actual_sums[nonempty] / counts[nonempty] - predicted_sums[nonempty] / counts[nonempty]
+    )
+    avg_calibration_error = calibration_errors.mean() if calibration_errors.size else 0
+    
+    return {
+        'accuracy': accuracy,
+        'total_predictions': total_predictions,
+        'correct_predictions': correct_predictions,
+        'avg_confidence': avg_confidence,
+        'brier_score': avg_brier_score,
+        'log_loss': avg_log_loss,
+        'calibration_error': avg_calibration_error,
+        'success': True
+    }
 
 
-def calculate_accuracy_metrics(games_df: pd.DataFrame, config: EloConfig) -> Dict[str, float]:
-    """Calculate comprehensive accuracy metrics for a configuration."""
+def calculate_accuracy_metrics(seasons: Tuple[int, ...], config: EloConfig) -> Dict[str, float]:
+    """Calculate comprehensive accuracy metrics for a configuration over completed games."""
     
     try:
         # Run backtest
-        result = run_backtest(games_df, config)
-        game_results = result.get('game_results', [])
+        df_results = _backtest_df(seasons, config)
         
-        if not game_results:
+        if df_results.empty:
             return {'error': 'No game results found'}
         
-        df_results = pd.DataFrame(game_results)
-        
-        # Basic accuracy metrics
-        correct_predictions = 0
-        total_predictions = 0
-        confidence_scores = []
-        brier_scores = []
-        log_losses = []
-        
-        for _, game in df_results.iterrows():
-            if pd.isna(game.get('home_win_prob')) or pd.isna(game.get('actual_winner')):
-                continue
-            
-            # Get prediction and actual result
-            home_win_prob = game['home_win_prob']
-            actual_winner = game['actual_winner']
-            
-            # Determine predicted winner
-            predicted_winner = 'home' if home_win_prob > 0.5 else 'away'
-            
-            # Calculate accuracy
-            if predicted_winner == actual_winner:
-                correct_predictions += 1
-            total_predictions += 1
-            
-            # Calculate confidence (distance from 0.5)
-            confidence = abs(home_win_prob - 0.5) * 2
-            confidence_scores.append(confidence)
-            
-            # Calculate Brier score
-            actual_binary = 1 if actual_winner == 'home' else 0
-            brier_score = (home_win_prob - actual_binary) ** 2
-            brier_scores.append(brier_score)
-            
-            # Calculate log loss
-            if actual_winner == 'home':
-                actual_prob = 1.0
-            else:
-                actual_prob = 0.0
-            
-            # Clip probabilities to avoid log(0)
-            clipped_prob = max(min(home_win_prob, 0.999), 0.001)
-            log_loss = -(actual_prob * np.log(clipped_prob) + (1 - actual_prob) * np.log(1 - clipped_prob))
-            log_losses.append(log_loss)
-        
-        if total_predictions == 0:
-            return {'error': 'No valid predictions found'}
-        
-        # Calculate final metrics
-        accuracy = correct_predictions / total_predictions
-        avg_confidence = np.mean(confidence_scores) if confidence_scores else 0
-        avg_brier_score = np.mean(brier_scores) if brier_scores else 1.0
-        avg_log_loss = np.mean(log_losses) if log_losses else float('inf')
-        
-        # Calculate calibration metrics
-        # Group predictions by confidence bins
-        confidence_bins = [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
-        calibration_errors = []
-        
-        for i in range(len(confidence_bins) - 1):
-            bin_start = confidence_bins[i]
-            bin_end = confidence_bins[i + 1]
-            
-            # Find games in this confidence bin
-            bin_games = df_results[
-                (df_results['home_win_prob'] >= bin_start) & 
-                (df_results['home_win_prob'] < bin_end)
-            ]
-            
-            if len(bin_games) > 0:
-                # Calculate actual win rate in this bin
-                actual_wins = (bin_games['actual_winner'] == 'home').sum()
-                actual_win_rate = actual_wins / len(bin_games)
-                
-                # Calculate predicted win rate (average of predictions in bin)
-                predicted_win_rate = bin_games['home_win_prob'].mean()
-                
-                # Calibration error is the difference
-                calibration_error = abs(actual_win_rate - predicted_win_rate)
-                calibration_errors.append(calibration_error)
-        
-        avg_calibration_error = np.mean(calibration_errors) if calibration_errors else 0
-        
-        return {
-            'accuracy': accuracy,
-            'total_predictions': total_predictions,
-            'correct_predictions': correct_predictions,
-            'avg_confidence': avg_confidence,
-            'brier_score': avg_brier_score,
-            'log_loss': avg_log_loss,
-            'calibration_error': avg_calibration_error,
-            'success': True
-        }
+        return _metrics_from_df(df_results)
         
     except Exception as e:
         return {'error': str(e), 'success': False}
@@ -237,23 +291,30 @@ def analyze_season_accuracy():
     configs = create_test_configurations()
     seasons = [2021, 2022, 2023, 2024]
     
-    # Test current config on each season
+    # Test current config with one backtest over all seasons, so ratings carry
+    # across season boundaries, then report each season separately
     current_config = configs['current_30pct']
     
+    try:
+        df_results = _backtest_df(tuple(seasons), current_config)
+    except Exception as e:
+        print(f"   Error: {e}")
+        return
+    
+    season_results = dict(tuple(df_results.groupby('season'))) if not df_results.empty else {}
+    
     for season in seasons:
         print(f"\n🏈 {season} Season:")
         
         try:
-            # Load season data
-            games = load_games([season])
-            completed_games = games.dropna(subset=['home_score', 'away_score'])
+            season_df = season_results.get(season)
             
-            if len(completed_games) < 10:
-                print(f"   Not enough games ({len(completed_games)})")
+            if season_df is None or len(season_df) < 10:
+                print(f"   Not enough games ({0 if season_df is None else len(season_df)})")
                 continue
             
             # Calculate metrics
-            metrics = calculate_accuracy_metrics(completed_games, current_config)
+            metrics = _metrics_from_df(season_df)
             
             if metrics.get('success'):
                 print(f"   Games: {metrics['total_predictions']}")
@@ -269,41 +330,67 @@ def analyze_season_accuracy():
             print(f"   Error: {e}")
 
 
-def compare_configurations():
-    """Compare accuracy across different configurations."""
+def compare_configurations(configs: Optional[Dict[str, EloConfig]] = None):
+    """Compare accuracy across different configurations (the named test set by default)."""
     
     print("\n🔬 CONFIGURATION COMPARISON")
     print("="*60)
     
-    configs = create_test_configurations()
+    if configs is None:
+        configs = create_test_configurations()
     
     # Load test data (2022-2024 for fair comparison)
-    test_games = load_games([2022, 2023, 2024])
-    completed_games = test_games.dropna(subset=['home_score', 'away_score'])
+    test_seasons = (2022, 2023, 2024)
+    completed_games = _load_completed(test_seasons)
     
     print(f"Test data: {len(completed_games)} games from 2022-2024")
     print()
     
-    results = {}
-    
-    for config_name, config in configs.items():
-        print(f"Testing {config_name}...")
+    # Configurations are independent, so backtest them in parallel; spawn keeps
+    # workers clear of thread pools (e.g. numba's) started in this process.
+    # The games are written to disk once and read by each worker at startup.
+    max_workers = min(len(configs), os.cpu_count() or 1)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        games_path = os.path.join(tmp_dir, 'completed_games.pkl')
+        completed_games.to_pickle(games_path)
         
-        try:
-            metrics = calculate_accuracy_metrics(completed_games, config)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(test_seasons, games_path),
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            # The base config's backtest is reused by the confidence and team analyses, so it
+            # runs here (filling _cached_backtest) while the workers score the others
+            futures = {
+                config_name: executor.submit(_evaluate_config, (config_name, test_seasons, config))
+                for config_name, config in configs.items() if config != BASE_CONFIG
+            }
+            local_metrics = {
+                config_name: calculate_accuracy_metrics(test_seasons, config)
+                for config_name, config in configs.items() if config == BASE_CONFIG
+            }
             
-            if metrics.get('success'):
-                results[config_name] = metrics
-                print(f"   ✅ Accuracy: {metrics['accuracy']:.3f}")
-                print(f"   ✅ Brier Score: {metrics['brier_score']:.3f}")
-                print(f"   ✅ Log Loss: {metrics['log_loss']:.3f}")
-            else:
-                print(f"   ❌ Error: {metrics.get('error', 'Unknown')}")
+            results = {}
+            
+            for config_name in configs:
+                print(f"Testing {config_name}...")
                 
-        except Exception as e:
-            print(f"   ❌ Exception: {e}")
-        
-        print()
+                try:
+                    if config_name in local_metrics:
+                        metrics = local_metrics[config_name]
+                    else:
+                        _, metrics = futures[config_name].result()
+                    
+                    if metrics.get('success'):
+                        results[config_name] = metrics
+                        print(f"   ✅ Accuracy: {metrics['accuracy']:.3f}")
+                        print(f"   ✅ Brier Score: {metrics['brier_score']:.3f}")
+                        print(f"   ✅ Log Loss: {metrics['log_loss']:.3f}")
+                    else:
+                        print(f"   ❌ Error: {metrics.get('error', 'Unknown')}")
+                        
+                except Exception as e:
+                    print(f"   ❌ Exception: {e}")
+                
+                print()
     
     # Create comparison table
     if results:
@@ -312,12 +399,14 @@ def compare_configurations():
         print(f"{'Configuration':<20} {'Accuracy':<10} {'Brier Score':<12} {'Log Loss':<10} {'Calibration':<12}")
         print("-" * 80)
         
-        for config_name, metrics in results.items():
-            print(f"{config_name:<20} "
-                  f"{metrics['accuracy']:.3f}      "
-                  f"{metrics['brier_score']:.3f}       "
-                  f"{metrics['log_loss']:.3f}    "
-                  f"{metrics['calibration_error']:.3f}")
+        sys.stdout.write(''.join(
+            f"{config_name:<20} "
+            f"{metrics['accuracy']:.3f}      "
+            f"{metrics['brier_score']:.3f}       "
+            f"{metrics['log_loss']:.3f}    "
+            f"{metrics['calibration_error']:.3f}\n"
+            for config_name, metrics in results.items()
+        ))
         
         # Find best configuration
         best_accuracy = max(results.items(), key=lambda x: x[1]['accuracy'])
@@ -339,45 +428,36 @@ def analyze_prediction_confidence():
     config = create_test_configurations()['current_30pct']
     
     # Load test data
-    test_games = load_games([2022, 2023, 2024])
-    completed_games = test_games.dropna(subset=['home_score', 'away_score'])
+    test_seasons = (2022, 2023, 2024)
     
     try:
-        result = run_backtest(completed_games, config)
-        game_results = result.get('game_results', [])
+        df_results = _backtest_df(test_seasons, config)
         
-        if not game_results:
+        if df_results.empty:
             print("No game results found")
             return
         
-        df_results = pd.DataFrame(game_results)
-        
-        # Group by confidence levels
-        confidence_bins = [
-            (0.5, 0.6, "50-60%"),
-            (0.6, 0.7, "60-70%"),
-            (0.7, 0.8, "70-80%"),
-            (0.8, 0.9, "80-90%"),
-            (0.9, 1.0, "90-100%")
-        ]
+        # Bin home-favored predictions once and aggregate every bin in one pass;
+        # all bins favor the home side, so a home win is a correct pick
+        labels = ["50-60%", "60-70%", "70-80%", "80-90%", "90-100%"]
+        bins = pd.cut(
+            df_results['home_win_prob'], [0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+            right=False, labels=labels
+        )
+        table = df_results.groupby(bins, observed=False).agg(
+            games=('home_won', 'size'),
+            accuracy=('home_won', 'mean'),
+            avg_conf=('home_win_prob', 'mean')
+        )
         
         print("Confidence Level | Games | Accuracy | Avg Confidence")
         print("-" * 50)
         
-        for bin_min, bin_max, label in confidence_bins:
-            bin_games = df_results[
-                (df_results['home_win_prob'] >= bin_min) & 
-                (df_results['home_win_prob'] < bin_max)
-            ]
-            
-            if len(bin_games) > 0:
-                correct = (bin_games['actual_winner'] == 'home').sum()
-                accuracy = correct / len(bin_games)
-                avg_conf = bin_games['home_win_prob'].mean()
-                
-                print(f"{label:<15} | {len(bin_games):<5} | {accuracy:.3f}    | {avg_conf:.3f}")
-            else:
-                print(f"{label:<15} | 0     | N/A     | N/A")
+        sys.stdout.write(''.join(
+            f"{label:<15} | {games:<5} | {accuracy:.3f}    | {avg_conf:.3f}\n" if games > 0
+            else f"{label:<15} | 0     | N/A     | N/A\n"
+            for label, games, accuracy, avg_conf in table.itertuples()
+        ))
                 
     except Exception as e:
         print(f"Error: {e}")
@@ -392,67 +472,50 @@ def analyze_team_specific_accuracy():
     config = create_test_configurations()['current_30pct']
     
     # Load test data
-    test_games = load_games([2022, 2023, 2024])
-    completed_games = test_games.dropna(subset=['home_score', 'away_score'])
+    test_seasons = (2022, 2023, 2024)
     
     try:
-        result = run_backtest(completed_games, config)
-        game_results = result.get('game_results', [])
+        df_results = _backtest_df(test_seasons, config)
         
-        if not game_results:
+        if df_results.empty:
             print("No game results found")
             return
         
-        df_results = pd.DataFrame(game_results)
-        
-        # Get all teams
-        all_teams = set(df_results['home_team'].unique()) | set(df_results['away_team'].unique())
+        # Scatter per-game counts onto team codes, once for the home team and once
+        # for the away team; both columns share the same team categories
+        teams = df_results['home_team'].cat.categories
+        home_codes = df_results['home_team'].cat.codes.to_numpy()
+        away_codes = df_results['away_team'].cat.codes.to_numpy()
+        valid = df_results['valid'].to_numpy()
+        correct = df_results['correct'].to_numpy()
         
-        team_accuracy = {}
+        n_teams = len(teams)
+        played = np.bincount(home_codes, minlength=n_teams) + np.bincount(away_codes, minlength=n_teams)
+        games = (np.bincount(home_codes, weights=valid, minlength=n_teams)
+                 + np.bincount(away_codes, weights=valid, minlength=n_teams))
+        correct_counts = (np.bincount(home_codes, weights=correct, minlength=n_teams)
+                          + np.bincount(away_codes, weights=correct, minlength=n_teams))
         
-        for team in all_teams:
-            if pd.isna(team):
-                continue
-            
-            # Get games where this team played
-            team_games = df_results[
-                (df_results['home_team'] == team) | (df_results['away_team'] == team)
-            ]
-            
-            if len(team_games) < 5:  # Need at least 5 games
-                continue
-            
-            correct = 0
-            total = 0
-            
-            for _, game in team_games.iterrows():
-                if pd.isna(game.get('home_win_prob')) or pd.isna(game.get('actual_winner')):
-                    continue
-                
-                # Determine if prediction was correct
-                predicted_winner = 'home' if game['home_win_prob'] > 0.5 else 'away'
-                actual_winner = game['actual_winner']
-                
-                if predicted_winner == actual_winner:
-                    correct += 1
-                total += 1
-            
-            if total > 0:
-                accuracy = correct / total
-                team_accuracy[team] = {
-                    'accuracy': accuracy,
-                    'games': total,
-                    'correct': correct
-                }
+        # Need at least 5 games played and one scored prediction
+        keep = np.flatnonzero((played >= 5) & (games > 0))
+        accuracy = correct_counts[keep] / games[keep]
         
-        # Sort by accuracy
-        sorted_teams = sorted(team_accuracy.items(), key=lambda x: x[1]['accuracy'], reverse=True)
+        # Sort by accuracy, keeping team order for ties
+        order = keep[np.argsort(-accuracy, kind='stable')]
+        team_stats = pd.DataFrame({
+            'games': games[order],
+            'correct': correct_counts[order],
+            'accuracy': correct_counts[order] / games[order]
+        }, index=teams[order])
         
         print("Team | Games | Correct | Accuracy")
         print("-" * 35)
         
-        for team, stats in sorted_teams[:15]:  # Top 15 teams
-            print(f"{team:<4} | {stats['games']:<5} | {stats['correct']:<7} | {stats['accuracy']:.3f}")
+        # Top 15 teams, written in one call
+        sys.stdout.write(''.join(
+            f"{team:<4} | {int(games):<5} | {int(correct):<7} | {accuracy:.3f}\n"
+            for team, games, correct, accuracy in team_stats.head(15).itertuples()
+        ))
             
     except Exception as e:
         print(f"Error: {e}")
@@ -467,8 +530,8 @@ if __name__ == "__main__":
     # Season-by-season analysis
     analyze_season_accuracy()
     
-    # Configuration comparison
-    compare_configurations()
+    # Configuration comparison (pass --grid to search the full CONFIG_GRID instead)
+    compare_configurations(create_grid_configurations() if '--grid' in sys.argv[1:] else None)
     
     # Confidence analysis
     analyze_prediction_confidence()
@@ -69,26 +69,20 @@ def calculate_and_store_elo_ratings():
         cursor.execute("DELETE FROM team_ratings WHERE season IN (2024, 2025) AND config_name = 'baseline'")
         
         # Insert new ratings for both 2024 and 2025
-        for team, rating in interface.team_ratings.items():
-            # Calculate basic stats (this is simplified - in reality you'd get this from game data)
-            wins = 0  # Placeholder - would calculate from actual games
-            losses = 0  # Placeholder - would calculate from actual games
-            win_pct = 0.5  # Placeholder - would calculate from actual games
-            rating_change = 0.0  # Placeholder - would calculate from previous week
-            
-            # Store for 2024
-            cursor.execute('''
-                INSERT OR REPLACE INTO team_ratings 
-                (team, rating, season, config_name, wins, losses, win_pct, rating_change)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (team, rating, 2024, 'baseline', wins, losses, win_pct, rating_change))
-            
-            # Store for 2025 (same ratings for now, will be updated as games are played)
-            cursor.execute('''
-                INSERT OR REPLACE INTO team_ratings 
-                (team, rating, season, config_name, wins, losses, win_pct, rating_change)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (team, rating, 2025, 'baseline', wins, losses, win_pct, rating_change))
+        # Basic stats are simplified placeholders - in reality you'd get these from game data
+        # and the previous week's ratings
+        wins, losses, win_pct, rating_change = 0, 0, 0.5, 0.0
+        # 2025 starts from the same ratings for now and is updated as games are played
+        rows = [
+            (team, rating, season, 'baseline', wins, losses, win_pct, rating_change)
+            for season in (2024, 2025)
+            for team, rating in interface.team_ratings.items()
+        ]
+        cursor.executemany('''
+            INSERT OR REPLACE INTO team_ratings 
+            (team, rating, season, config_name, wins, losses, win_pct, rating_change)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
         
         conn.commit()
         conn.close()
@@ -89,19 +89,20 @@ def test_prediction_accuracy():
             confidence_scores = []
             brier_scores = []
             
-            for _, game in completed_2024.iterrows():
+            games = completed_2024[['home_team', 'away_team', 'home_score', 'away_score']]
+            for game in games.itertuples(index=False):
                 try:
                     # Get prediction
                     prediction = interface.predict_game(
-                        game['home_team'], 
-                        game['away_team']
+                        game.home_team, 
+                        game.away_team
                     )
                     
                     if prediction is None:
                         continue
                     
                     home_win_prob = prediction['home_win_probability']  # Corrected field name
-                    actual_winner = 'home' if game['home_score'] > game['away_score'] else 'away'
+                    actual_winner = 'home' if game.home_score > game.away_score else 'away'
                     
                     # Determine predicted winner
                     predicted_winner = 'home' if home_win_prob > 0.5 else 'away'
@@ -329,11 +330,11 @@ def test_confidence_distribution():
         
         total_predictions = 0
         
-        for _, game in completed_2024.iterrows():
+        for game in completed_2024[['home_team', 'away_team']].itertuples(index=False):
             try:
                 prediction = interface.predict_game(
-                    game['home_team'], 
-                    game['away_team']
+                    game.home_team, 
+                    game.away_team
                 )
                 
                 if prediction:
@@ -74,25 +74,27 @@ def proper_walk_forward_backtest(games_df: pd.DataFrame, config: EloConfig, test
     interface.team_ratings = final_ratings  # Use only historical ratings
     
     # Test each game in chronological order
-    test_games_sorted = test_games.sort_values(['week', 'game_id'])
+    test_games_sorted = test_games.sort_values(['week', 'game_id'])[
+        ['week', 'home_team', 'away_team', 'home_score', 'away_score']
+    ]
     
     predictions = []
     correct_predictions = 0
     total_predictions = 0
     
-    for _, game in test_games_sorted.iterrows():
+    for game in test_games_sorted.itertuples(index=False):
         try:
             # Make prediction using only historical data
             prediction = interface.predict_game(
-                game['home_team'], 
-                game['away_team']
+                game.home_team, 
+                game.away_team
             )
             
             if prediction is None:
                 continue
             
             # Get actual result
-            actual_winner = 'home' if game['home_score'] > game['away_score'] else 'away'
+            actual_winner = 'home' if game.home_score > game.away_score else 'away'
             predicted_winner = 'home' if prediction['home_win_probability'] > 0.5 else 'away'
             
             # Check if prediction was correct
@@ -104,11 +106,11 @@ def proper_walk_forward_backtest(games_df: pd.DataFrame, config: EloConfig, test
             
             # Store prediction details
             predictions.append({
-                'week': game['week'],
-                'home_team': game['home_team'],
-                'away_team': game['away_team'],
-                'home_score': game['home_score'],
-                'away_score': game['away_score'],
+                'week': game.week,
+                'home_team': game.home_team,
+                'away_team': game.away_team,
+                'home_score': game.home_score,
+                'away_score': game.away_score,
                 'predicted_winner': predicted_winner,
                 'actual_winner': actual_winner,
                 'home_win_prob': prediction['home_win_probability'],
@@ -123,7 +125,7 @@ def proper_walk_forward_backtest(games_df: pd.DataFrame, config: EloConfig, test
             # For now, we'll just track the predictions without updating
             
         except Exception as e:
-            print(f"Error predicting game {game['home_team']} vs {game['away_team']}: {e}")
+            print(f"Error predicting game {game.home_team} vs {game.away_team}: {e}")
             continue
     
     # Calculate accuracy metrics
@@ -89,20 +89,24 @@ def test_prediction_accuracy():
             confidence_scores = []
             brier_scores = []
             
-            for _, game in completed_2024.iterrows():
+            # Games without a week column are predicted as week 1
+            games = completed_2024.reindex(
+                columns=['home_team', 'away_team', 'week', 'home_score', 'away_score'], fill_value=1
+            )
+            for game in games.itertuples(index=False):
                 try:
                     # Get prediction
                     prediction = interface.predict_game(
-                        game['home_team'], 
-                        game['away_team'], 
-                        game.get('week', 1)
+                        game.home_team, 
+                        game.away_team, 
+                        game.week
                     )
                     
                     if prediction is None:
                         continue
                     
                     home_win_prob = prediction['home_win_prob']
-                    actual_winner = 'home' if game['home_score'] > game['away_score'] else 'away'
+                    actual_winner = 'home' if game.home_score > game.away_score else 'away'
                     
                     # Determine predicted winner
                     predicted_winner = 'home' if home_win_prob > 0.5 else 'away'
@@ -189,10 +189,12 @@ def test_prediction_accuracy():
                 correct = 0
                 total = 0
                 
-                for _, game in df_results.iterrows():
-                    if pd.notna(game.get('home_win_prob')) and pd.notna(game.get('actual_winner')):
-                        predicted_winner = 'home' if game['home_win_prob'] > 0.5 else 'away'
-                        actual_winner = game['actual_winner']
+                # Missing result columns come back as NaN and the rows are skipped
+                results = df_results.reindex(columns=['home_win_prob', 'actual_winner'])
+                for game in results.itertuples(index=False):
+                    if pd.notna(game.home_win_prob) and pd.notna(game.actual_winner):
+                        predicted_winner = 'home' if game.home_win_prob > 0.5 else 'away'
+                        actual_winner = game.actual_winner
                         
                         if predicted_winner == actual_winner:
                             correct += 1
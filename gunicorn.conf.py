@@ -0,0 +1,16 @@
+"""Gunicorn settings for serving wsgi:app."""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('API_BIND', '0.0.0.0:8000')
+
+# Threaded workers let SQLite reads and response building overlap across requests
+workers = int(os.environ.get('API_WORKERS', min(4, multiprocessing.cpu_count())))
+worker_class = 'gthread'
+threads = int(os.environ.get('API_THREADS', 8))
+
+# Import the app (analyzers, caches, index setup) once in the master and fork workers from it
+preload_app = True
+
+accesslog = '-'
@@ -312,40 +312,47 @@ class ActionNetworkAnalyzer:
         cursor = conn.cursor()
         
         try:
-            # Get picks with social metrics
+            # Aggregate picks with social metrics in one pass: 10+ likes and 5+ copies
+            # count as high engagement
             cursor.execute('''
-                SELECT result, social_likes, social_copies, units_net, odds
+                SELECT COUNT(*) as total_picks,
+                       SUM(CASE WHEN result = 'win' THEN 1 ELSE 0 END) as wins,
+                       SUM(CASE WHEN result = 'loss' THEN 1 ELSE 0 END) as losses,
+                       SUM(CASE WHEN social_likes >= 10 THEN 1 ELSE 0 END) as high_likes_picks,
+                       SUM(CASE WHEN social_likes >= 10 AND result = 'win' THEN 1 ELSE 0 END) as high_likes_wins,
+                       SUM(CASE WHEN social_likes >= 10 AND result = 'loss' THEN 1 ELSE 0 END) as high_likes_losses,
+                       SUM(CASE WHEN social_copies >= 5 THEN 1 ELSE 0 END) as high_copies_picks,
+                       SUM(CASE WHEN social_copies >= 5 AND result = 'win' THEN 1 ELSE 0 END) as high_copies_wins,
+                       SUM(CASE WHEN social_copies >= 5 AND result = 'loss' THEN 1 ELSE 0 END) as high_copies_losses,
+                       AVG(social_likes) as avg_likes,
+                       AVG(social_copies) as avg_copies
                 FROM action_network_picks
                 WHERE league_name = ? AND social_likes > 0
-                ORDER BY social_likes DESC
             ''', (league,))
             
-            picks = cursor.fetchall()
+            (total_picks, wins, losses,
+             high_likes_picks, high_likes_wins, high_likes_losses,
+             high_copies_picks, high_copies_wins, high_copies_losses,
+             avg_likes, avg_copies) = cursor.fetchone()
             
-            if not picks:
+            if not total_picks:
                 return {'error': 'No picks with social metrics found'}
             
-            # Analyze correlation between social metrics and performance
-            high_likes = [p for p in picks if p[1] >= 10]  # 10+ likes
-            high_copies = [p for p in picks if p[2] >= 5]  # 5+ copies
-            
-            def calculate_win_rate(pick_list):
-                if not pick_list:
+            def calculate_win_rate(pick_count, wins, losses):
+                if not pick_count:
                     return 0
-                wins = len([p for p in pick_list if p[0] == 'win'])
-                losses = len([p for p in pick_list if p[0] == 'loss'])
                 return (wins / max(wins + losses, 1)) * 100
             
             return {
                 'league': league,
-                'total_picks_with_social': len(picks),
-                'high_likes_picks': len(high_likes),
-                'high_copies_picks': len(high_copies),
-                'overall_win_rate': calculate_win_rate(picks),
-                'high_likes_win_rate': calculate_win_rate(high_likes),
-                'high_copies_win_rate': calculate_win_rate(high_copies),
-                'avg_likes': sum(p[1] for p in picks) / len(picks),
-                'avg_copies': sum(p[2] for p in picks) / len(picks)
+                'total_picks_with_social': total_picks,
+                'high_likes_picks': high_likes_picks,
+                'high_copies_picks': high_copies_picks,
+                'overall_win_rate': calculate_win_rate(total_picks, wins, losses),
+                'high_likes_win_rate': calculate_win_rate(high_likes_picks, high_likes_wins, high_likes_losses),
+                'high_copies_win_rate': calculate_win_rate(high_copies_picks, high_copies_wins, high_copies_losses),
+                'avg_likes': avg_likes,
+                'avg_copies': avg_copies
             }
             
         except Exception as e:
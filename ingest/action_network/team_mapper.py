@@ -1,9 +1,49 @@
 """Team mapping utilities for Action Network integration."""
 
 import sqlite3
+import time
 from typing import Dict, List, Optional, Tuple
 import logging
 
+# Seconds get_nfl_games_with_teams() reuses its last result; the games list changes at most hourly
+GAMES_CACHE_TTL = 300
+
+# Standard NFL team names (as used in the existing system)
+STANDARD_TEAM_NAMES = {
+    'ARI': 'Arizona Cardinals',
+    'ATL': 'Atlanta Falcons', 
+    'BAL': 'Baltimore Ravens',
+    'BUF': 'Buffalo Bills',
+    'CAR': 'Carolina Panthers',
+    'CHI': 'Chicago Bears',
+    'CIN': 'Cincinnati Bengals',
+    'CLE': 'Cleveland Browns',
+    'DAL': 'Dallas Cowboys',
+    'DEN': 'Denver Broncos',
+    'DET': 'Detroit Lions',
+    'GB': 'Green Bay Packers',
+    'HOU': 'Houston Texans',
+    'IND': 'Indianapolis Colts',
+    'JAX': 'Jacksonville Jaguars',
+    'KC': 'Kansas City Chiefs',
+    'LV': 'Las Vegas Raiders',
+    'LAC': 'Los Angeles Chargers',
+    'LAR': 'Los Angeles Rams',
+    'MIA': 'Miami Dolphins',
+    'MIN': 'Minnesota Vikings',
+    'NE': 'New England Patriots',
+    'NO': 'New Orleans Saints',
+    'NYG': 'New York Giants',
+    'NYJ': 'New York Jets',
+    'PHI': 'Philadelphia Eagles',
+    'PIT': 'Pittsburgh Steelers',
+    'SF': 'San Francisco 49ers',
+    'SEA': 'Seattle Seahawks',
+    'TB': 'Tampa Bay Buccaneers',
+    'TEN': 'Tennessee Titans',
+    'WAS': 'Washington Commanders'
+}
+
 
 class ActionNetworkTeamMapper:
     """Maps Action Network team IDs to existing NFL team references."""
@@ -23,6 +63,10 @@ class ActionNetworkTeamMapper:
             # This mapping will be populated from the database
         }
         
+        # Results derived from the loaded mappings or re-read only every GAMES_CACHE_TTL seconds
+        self._standard_mapping: Optional[Dict[int, str]] = None
+        self._games_cache: Optional[Tuple[float, List[Dict[str, any]]]] = None
+        
         # Load team mappings from database
         self._load_team_mappings()
     
@@ -88,49 +132,16 @@ class ActionNetworkTeamMapper:
         Returns:
             Dictionary mapping AN team ID to standard team name
         """
-        # Standard NFL team names (as used in the existing system)
-        standard_team_names = {
-            'ARI': 'Arizona Cardinals',
-            'ATL': 'Atlanta Falcons', 
-            'BAL': 'Baltimore Ravens',
-            'BUF': 'Buffalo Bills',
-            'CAR': 'Carolina Panthers',
-            'CHI': 'Chicago Bears',
-            'CIN': 'Cincinnati Bengals',
-            'CLE': 'Cleveland Browns',
-            'DAL': 'Dallas Cowboys',
-            'DEN': 'Denver Broncos',
-            'DET': 'Detroit Lions',
-            'GB': 'Green Bay Packers',
-            'HOU': 'Houston Texans',
-            'IND': 'Indianapolis Colts',
-            'JAX': 'Jacksonville Jaguars',
-            'KC': 'Kansas City Chiefs',
-            'LV': 'Las Vegas Raiders',
-            'LAC': 'Los Angeles Chargers',
-            'LAR': 'Los Angeles Rams',
-            'MIA': 'Miami Dolphins',
-            'MIN': 'Minnesota Vikings',
-            'NE': 'New England Patriots',
-            'NO': 'New Orleans Saints',
-            'NYG': 'New York Giants',
-            'NYJ': 'New York Jets',
-            'PHI': 'Philadelphia Eagles',
-            'PIT': 'Pittsburgh Steelers',
-            'SF': 'San Francisco 49ers',
-            'SEA': 'Seattle Seahawks',
-            'TB': 'Tampa Bay Buccaneers',
-            'TEN': 'Tennessee Titans',
-            'WAS': 'Washington Commanders'
-        }
+        # The team mappings are loaded once, so the standard mapping only needs building once
+        if self._standard_mapping is None:
+            mapping = {}
+            for an_id, team_info in self.nfl_team_mapping.items():
+                abbr = team_info['abbr']
+                if abbr in STANDARD_TEAM_NAMES:
+                    mapping[an_id] = STANDARD_TEAM_NAMES[abbr]
+            self._standard_mapping = mapping
         
-        mapping = {}
-        for an_id, team_info in self.nfl_team_mapping.items():
-            abbr = team_info['abbr']
-            if abbr in standard_team_names:
-                mapping[an_id] = standard_team_names[abbr]
-        
-        return mapping
+        return self._standard_mapping
     
     def get_nfl_games_with_teams(self) -> List[Dict[str, any]]:
         """
@@ -139,6 +150,10 @@ class ActionNetworkTeamMapper:
         Returns:
             List of NFL games with team details
         """
+        cached = self._games_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         
@@ -161,6 +176,7 @@ class ActionNetworkTeamMapper:
                 game = dict(zip(columns, row))
                 games.append(game)
             
+            self._games_cache = (time.monotonic() + GAMES_CACHE_TTL, games)
             return games
             
         except Exception as e:
@@ -239,29 +255,25 @@ class ActionNetworkTeamMapper:
             
             expert_id = expert_result[0]
             
-            # Get NFL picks for this expert
+            # Aggregate NFL picks for this expert
             cursor.execute('''
-                SELECT result, units_net, odds, units, created_at
+                SELECT COUNT(*) as total_picks,
+                       SUM(CASE WHEN result = 'win' THEN 1 ELSE 0 END) as winning_picks,
+                       SUM(CASE WHEN result = 'loss' THEN 1 ELSE 0 END) as losing_picks,
+                       SUM(CASE WHEN result = 'pending' THEN 1 ELSE 0 END) as pending_picks,
+                       COALESCE(SUM(units_net), 0) as total_units_net,
+                       COALESCE(AVG(odds), 0.0) as avg_odds,
+                       COALESCE(AVG(units), 0.0) as avg_units
                 FROM action_network_picks
                 WHERE expert_id = ? AND league_name = 'nfl'
-                ORDER BY created_at DESC
             ''', (expert_id,))
             
-            picks = cursor.fetchall()
+            (total_picks, winning_picks, losing_picks, pending_picks,
+             total_units_net, avg_odds, avg_units) = cursor.fetchone()
             
-            if not picks:
+            if not total_picks:
                 return {'error': 'No NFL picks found for this expert'}
             
-            # Calculate performance metrics
-            total_picks = len(picks)
-            winning_picks = len([p for p in picks if p[0] == 'win'])
-            losing_picks = len([p for p in picks if p[0] == 'loss'])
-            pending_picks = len([p for p in picks if p[0] == 'pending'])
-            
-            total_units_net = sum(p[1] for p in picks if p[1] is not None)
-            avg_odds = sum(p[2] for p in picks if p[2] is not None) / max(len([p for p in picks if p[2] is not None]), 1)
-            avg_units = sum(p[3] for p in picks if p[3] is not None) / max(len([p for p in picks if p[3] is not None]), 1)
-            
             win_rate = (winning_picks / max(winning_picks + losing_picks, 1)) * 100
             
             return {
@@ -13,6 +13,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Index backing the per-season ratings queries (filter on season, order by rating)
+TEAM_RATINGS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_team_ratings_season_rating "
+    "ON team_ratings(season, rating DESC)",
+)
+
 class EloDataService:
     """Service for retrieving ELO ratings and related data."""
     
@@ -20,6 +26,20 @@ class EloDataService:
         self.db_path = Path(db_path)
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
+        self._ensure_indexes()
+    
+    def _ensure_indexes(self):
+        """Create the indexes the ratings queries rely on, if their table exists."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                for statement in TEAM_RATINGS_INDEXES:
+                    conn.execute(statement)
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Skipping index creation: {e}")
     
     def get_available_seasons(self) -> List[int]:
         """Get list of available seasons from team_ratings table."""
@@ -150,12 +170,52 @@ class EloDataService:
         
         return ratings
     
+    def _load_stored_history(self, team: str, seasons: List[int]) -> Dict[int, tuple]:
+        """Map each requested season with stored ratings to the team's (rating, rank) there.
+        
+        Every team in the requested seasons is ranked in one query; a stored season the team
+        has no rating in maps to (None, None).
+        """
+        placeholders = ','.join('?' for _ in seasons)
+        try:
+            conn = sqlite3.connect(self.db_path)
+            rows = conn.execute(f'''
+                SELECT season,
+                       MAX(CASE WHEN team = ? THEN rating END),
+                       MAX(CASE WHEN team = ? THEN rank END)
+                FROM (
+                    SELECT team, season, rating,
+                           ROW_NUMBER() OVER (PARTITION BY season ORDER BY rating DESC) AS rank
+                    FROM team_ratings
+                    WHERE season IN ({placeholders})
+                )
+                GROUP BY season
+            ''', [team, team, *seasons]).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading stored rating history for {team}: {e}")
+            return {}
+        
+        return {season: (rating, rank) for season, rating, rank in rows}
+    
     def get_rating_history(self, team: str, seasons: List[int]) -> List[Dict[str, Any]]:
         """Get rating history for a specific team across seasons."""
         try:
-            # For now, generate sample history
+            stored = self._load_stored_history(team, seasons)
+            
             history = []
             for season in seasons:
+                if season in stored:
+                    rating, rank = stored[season]
+                    if rating is not None:
+                        history.append({
+                            "season": season,
+                            "rating": round(rating, 1),
+                            "rank": rank
+                        })
+                    continue
+                
+                # Seasons without stored ratings fall back to sample data
                 ratings = self._generate_sample_ratings(season)
                 team_rating = next((r for r in ratings if r["team"] == team), None)
                 if team_rating:
@@ -9,6 +9,27 @@ import logging
 
 from .config import EloConfig
 
+# Picks carry a denormalized copy of their expert's name so the picks API can skip the
+# experts join; these triggers keep it in step with inserts, re-pointed picks, and expert
+# inserts or renames
+PICKS_EXPERT_NAME_SQL = (
+    "UPDATE action_network_picks "
+    "SET expert_name = (SELECT name FROM action_network_experts WHERE id = NEW.expert_id) "
+    "WHERE id = NEW.id"
+)
+EXPERT_NAME_TRIGGERS = (
+    "CREATE TRIGGER IF NOT EXISTS trg_an_picks_expert_name_insert "
+    f"AFTER INSERT ON action_network_picks BEGIN {PICKS_EXPERT_NAME_SQL}; END",
+    "CREATE TRIGGER IF NOT EXISTS trg_an_picks_expert_name_update "
+    f"AFTER UPDATE OF expert_id ON action_network_picks BEGIN {PICKS_EXPERT_NAME_SQL}; END",
+    "CREATE TRIGGER IF NOT EXISTS trg_an_experts_name_insert "
+    "AFTER INSERT ON action_network_experts BEGIN "
+    "UPDATE action_network_picks SET expert_name = NEW.name WHERE expert_id = NEW.id; END",
+    "CREATE TRIGGER IF NOT EXISTS trg_an_experts_name_update "
+    "AFTER UPDATE OF name ON action_network_experts BEGIN "
+    "UPDATE action_network_picks SET expert_name = NEW.name WHERE expert_id = NEW.id; END",
+)
+
 
 class ActionNetworkStorage:
     """Storage system for Action Network expert picks and performance data."""
@@ -99,10 +120,24 @@ class ActionNetworkStorage:
                     custom_pick_type TEXT,
                     custom_pick_name TEXT,
                     verified BOOLEAN,
+                    expert_name TEXT,
                     FOREIGN KEY (expert_id) REFERENCES action_network_experts(id)
                 )
             ''')
             
+            # Databases created before expert_name existed get the column and a backfill of
+            # the rows written before the triggers existed
+            pick_columns = {row[1] for row in cursor.execute('PRAGMA table_info(action_network_picks)')}
+            if 'expert_name' not in pick_columns:
+                cursor.execute('ALTER TABLE action_network_picks ADD COLUMN expert_name TEXT')
+            for statement in EXPERT_NAME_TRIGGERS:
+                cursor.execute(statement)
+            cursor.execute('''
+                UPDATE action_network_picks
+                SET expert_name = (SELECT name FROM action_network_experts WHERE id = expert_id)
+                WHERE expert_name IS NULL
+            ''')
+            
             # Create games tracking table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS action_network_games (
@@ -148,6 +183,8 @@ class ActionNetworkStorage:
             ''')
             
             # Create indexes for better performance
+            index_count = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'"
+            indexes_before = cursor.execute(index_count).fetchone()[0]
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_picks_expert_id ON action_network_picks(expert_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_picks_game_id ON action_network_picks(game_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_picks_league ON action_network_picks(league_name)')
@@ -157,7 +194,25 @@ class ActionNetworkStorage:
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_games_season ON action_network_games(season)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_experts_an_id ON action_network_experts(an_expert_id)')
             
+            # Composite indexes matching the API's expert-details and picks predicates plus
+            # their ORDER BY
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_perf_expert_recorded ON action_network_expert_performance(expert_id, recorded_at DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_picks_expert_created ON action_network_picks(expert_id, created_at DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_picks_league_created ON action_network_picks(league_name, created_at DESC)')
+            # Covering indexes for the game and team lookups joined onto each returned pick
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_games_pick_cover ON action_network_games(an_game_id, start_time, game_status, home_team_id, away_team_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_an_teams_name_cover ON action_network_teams(an_team_id, full_name, abbr)')
+            
             conn.commit()
+            
+            # Refresh planner statistics once new indexes exist
+            if cursor.execute(index_count).fetchone()[0] != indexes_before:
+                cursor.execute('ANALYZE')
+                conn.commit()
+            
+            # WAL persists in the file, letting the API's read-only readers run alongside
+            # ingest writes
+            cursor.execute('PRAGMA journal_mode=WAL')
             self.logger.info("Action Network database tables initialized successfully")
             
         except Exception as e:
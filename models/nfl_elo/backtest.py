@@ -12,6 +12,20 @@ from .features import apply_all_adjustments
 import warnings
 
 
+# Per-game columns recorded in the backtest history, in row order
+HISTORY_COLUMNS = (
+    "season", "week", "game_id", "home_team", "away_team", "home_score", "away_score",
+    "p_home", "home_win", "home_rating_pre", "away_rating_pre",
+    "home_rating_post", "away_rating_post", "home_rest", "away_rest",
+    "qb_home_delta", "qb_away_delta", "weather_home_delta", "weather_away_delta",
+    "travel_home_delta", "travel_away_delta"
+)
+OFFDEF_HISTORY_COLUMNS = (
+    "home_off_pre", "home_def_pre", "away_off_pre", "away_def_pre",
+    "home_off_post", "home_def_post", "away_off_post", "away_def_post"
+)
+
+
 def preseason_reset(ratings: RatingBook, cfg: EloConfig) -> None:
     """
     Apply preseason regression to all team ratings.
@@ -67,8 +81,12 @@ def run_backtest(games: pd.DataFrame, cfg: EloConfig, qb_data: Optional[pd.DataF
         for team in all_teams:
             ratings.set_offdef(team, cfg.base_rating, cfg.base_rating)
     
-    # Store game results
-    game_results = []
+    # Store game results column-wise so the history frame is built straight from lists
+    history_columns = list(HISTORY_COLUMNS)
+    if cfg.use_offdef_split:
+        history_columns += OFFDEF_HISTORY_COLUMNS
+    history = {name: [] for name in history_columns}
+    history_lists = tuple(history.values())
     
     # Process each season
     for season in sorted(games["season"].unique()):
@@ -251,51 +269,46 @@ def run_backtest(games: pd.DataFrame, cfg: EloConfig, qb_data: Optional[pd.DataF
                 ratings.set(game["away_team"], new_away_rating)
                 
                 # Record game result
-                game_result = {
-                    "season": int(game["season"]),
-                    "week": int(game["week"]),
-                    "game_id": game.get("game_id", f"{season}_{game['week']}_{game['home_team']}_{game['away_team']}"),
-                    "home_team": game["home_team"],
-                    "away_team": game["away_team"],
-                    "home_score": int(game["home_score"]),
-                    "away_score": int(game["away_score"]),
-                    "p_home": p_home,
-                    "home_win": 1 if game["home_score"] > game["away_score"] else 0,
-                    "home_rating_pre": home_rating,
-                    "away_rating_pre": away_rating,
-                    "home_rating_post": new_home_rating,
-                    "away_rating_post": new_away_rating,
-                    "home_rest": home_rest,
-                    "away_rest": away_rest,
-                    "qb_home_delta": qb_home_delta,
-                    "qb_away_delta": qb_away_delta,
-                    "weather_home_delta": weather_home_delta,
-                    "weather_away_delta": weather_away_delta,
-                    "travel_home_delta": travel_home_delta,
-                    "travel_away_delta": travel_away_delta
-                }
+                row = (
+                    int(game["season"]),
+                    int(game["week"]),
+                    game.get("game_id", f"{season}_{game['week']}_{game['home_team']}_{game['away_team']}"),
+                    game["home_team"],
+                    game["away_team"],
+                    int(game["home_score"]),
+                    int(game["away_score"]),
+                    p_home,
+                    1 if game["home_score"] > game["away_score"] else 0,
+                    home_rating,
+                    away_rating,
+                    new_home_rating,
+                    new_away_rating,
+                    home_rest,
+                    away_rest,
+                    qb_home_delta,
+                    qb_away_delta,
+                    weather_home_delta,
+                    weather_away_delta,
+                    travel_home_delta,
+                    travel_away_delta
+                )
                 
                 # Add offense/defense ratings if enabled
                 if cfg.use_offdef_split:
-                    game_result.update({
-                        "home_off_pre": home_off,
-                        "home_def_pre": home_def,
-                        "away_off_pre": away_off,
-                        "away_def_pre": away_def,
-                        "home_off_post": new_home_off,
-                        "home_def_post": new_home_def,
-                        "away_off_post": new_away_off,
-                        "away_def_post": new_away_def
-                    })
+                    row += (
+                        home_off, home_def, away_off, away_def,
+                        new_home_off, new_home_def, new_away_off, new_away_def
+                    )
                 
-                game_results.append(game_result)
+                for column, value in zip(history_lists, row):
+                    column.append(value)
                 
             except Exception as e:
                 warnings.warn(f"Error processing game {game.get('game_id', 'unknown')}: {e}")
                 continue
     
     # Convert to DataFrame
-    results_df = pd.DataFrame(game_results)
+    results_df = pd.DataFrame(history)
     
     if len(results_df) == 0:
         return {"error": "No games processed successfully"}
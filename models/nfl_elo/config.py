@@ -110,6 +110,13 @@ class EloConfig(BaseModel):
     turnover_max_delta: float = Field(default=6.0, description="Maximum turnover adjustment in points")
     turnover_impact_threshold: float = Field(default=0.01, description="Minimum turnover impact to apply adjustment")
 
+    def __hash__(self) -> int:
+        """Hash by field values so equal configs share cache entries.
+        
+        Configs are mutable, so don't modify one while it is used as a cache key.
+        """
+        return hash(self.model_dump_json())
+
     class Config:
         """Pydantic configuration."""
         json_encoders = {
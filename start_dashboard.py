@@ -4,6 +4,7 @@ NFL Elo Dashboard Startup Script
 Starts both backend API server and React frontend, then displays stats
 """
 
+import importlib.util
 import subprocess
 import time
 import requests
@@ -24,8 +25,13 @@ class DashboardManager:
         """Start the FastAPI backend server"""
         print("🚀 Starting API server...")
         try:
+            # Serve through gunicorn's threaded workers when installed, else the dev server
+            if importlib.util.find_spec("gunicorn"):
+                command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"]
+            else:
+                command = [sys.executable, "api_server.py"]
             self.api_process = subprocess.Popen(
-                [sys.executable, "api_server.py"],
+                command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 cwd=os.getcwd()
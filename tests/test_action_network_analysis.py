@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the Action Network SQL aggregates over unsettled picks.
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.nfl_elo.action_network_storage import ActionNetworkStorage
+from ingest.action_network.analysis_tools import ActionNetworkAnalyzer
+from ingest.action_network.team_mapper import ActionNetworkTeamMapper
+
+class TestActionNetworkAggregates(unittest.TestCase):
+    """Aggregates must count zero, not NULL, when no pick has a result yet."""
+
+    def setUp(self):
+        """Set up a test database with one expert whose NFL picks have no result."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+
+        ActionNetworkStorage(self.db_path)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT INTO action_network_experts (id, an_expert_id, name) VALUES (1, 101, 'Test Expert')"
+        )
+        conn.executemany(
+            "INSERT INTO action_network_picks "
+            "(an_pick_id, expert_id, league_name, result, odds, units, social_likes, social_copies) "
+            "VALUES (?, 1, 'nfl', NULL, -110, 1.0, ?, ?)",
+            [(1, 12, 6), (2, 3, 1)]
+        )
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        """Clean up test database."""
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+
+    def test_social_metrics_without_results(self):
+        """Picks with no result give a zero win rate instead of an error."""
+        analysis = ActionNetworkAnalyzer(self.db_path).get_social_metrics_analysis('nfl')
+
+        self.assertNotIn('error', analysis)
+        self.assertEqual(analysis['total_picks_with_social'], 2)
+        self.assertEqual(analysis['high_likes_picks'], 1)
+        self.assertEqual(analysis['high_copies_picks'], 1)
+        self.assertEqual(analysis['overall_win_rate'], 0)
+        self.assertEqual(analysis['high_likes_win_rate'], 0)
+
+    def test_expert_nfl_performance_without_results(self):
+        """Picks with no result are counted but report zero wins, losses and pending."""
+        performance = ActionNetworkTeamMapper(self.db_path).get_expert_nfl_performance('Test Expert')
+
+        self.assertNotIn('error', performance)
+        self.assertEqual(performance['total_picks'], 2)
+        self.assertEqual(
+            (performance['winning_picks'], performance['losing_picks'], performance['pending_picks']),
+            (0, 0, 0)
+        )
+        self.assertEqual(performance['win_rate'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the Action Network storage schema and its denormalized expert names.
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.nfl_elo.action_network_storage import ActionNetworkStorage
+
+class TestExpertNameSchema(unittest.TestCase):
+    """Test cases for the expert_name column, its backfill and its triggers."""
+
+    def setUp(self):
+        """Set up a database laid out as before picks carried expert_name."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE action_network_experts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                an_expert_id INTEGER UNIQUE NOT NULL,
+                name TEXT NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE action_network_picks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                an_pick_id INTEGER UNIQUE NOT NULL,
+                expert_id INTEGER,
+                game_id INTEGER,
+                league_name TEXT,
+                result TEXT,
+                created_at TIMESTAMP
+            )
+        """)
+        conn.execute("INSERT INTO action_network_experts (id, an_expert_id, name) VALUES (1, 101, 'Old Name')")
+        conn.execute("INSERT INTO action_network_picks (an_pick_id, expert_id, league_name) VALUES (1, 1, 'nfl')")
+        conn.commit()
+        conn.close()
+
+        ActionNetworkStorage(self.db_path)
+
+    def tearDown(self):
+        """Clean up test database and its WAL files."""
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.db_path + suffix):
+                os.unlink(self.db_path + suffix)
+
+    def _expert_names(self):
+        conn = sqlite3.connect(self.db_path)
+        names = dict(conn.execute("SELECT an_pick_id, expert_name FROM action_network_picks"))
+        conn.close()
+        return names
+
+    def test_existing_picks_backfilled(self):
+        """Picks stored before the column existed get their expert's name."""
+        self.assertEqual(self._expert_names(), {1: 'Old Name'})
+
+    def test_triggers_follow_inserts_and_renames(self):
+        """New picks, re-pointed picks and renamed experts keep expert_name in step."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("INSERT INTO action_network_experts (id, an_expert_id, name) VALUES (2, 102, 'Second')")
+        conn.execute("INSERT INTO action_network_picks (an_pick_id, expert_id, league_name) VALUES (2, 2, 'nfl')")
+        conn.execute("INSERT INTO action_network_picks (an_pick_id, expert_id, league_name) VALUES (3, 3, 'nfl')")
+        conn.execute("UPDATE action_network_experts SET name = 'New Name' WHERE id = 1")
+        conn.execute("INSERT INTO action_network_experts (id, an_expert_id, name) VALUES (3, 103, 'Late')")
+        conn.commit()
+        conn.close()
+
+        self.assertEqual(self._expert_names(), {1: 'New Name', 2: 'Second', 3: 'Late'})
+
+    def test_reinitializing_keeps_schema(self):
+        """Running the setup again on a migrated database is a no-op."""
+        ActionNetworkStorage(self.db_path)
+
+        self.assertEqual(self._expert_names(), {1: 'Old Name'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the advanced NFL scraper's per-host request pacing.
+"""
+
+import unittest
+import io
+import os
+import sys
+from unittest import mock
+
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import advanced_nfl_scraper
+from advanced_nfl_scraper import AdvancedNFLScraper
+
+def _network_send(adapter, request, **kwargs):
+    """Stand-in for the network: an immediate 200 scoreboard response."""
+    raw = HTTPResponse(body=io.BytesIO(b'{"events": []}'), status=200, preload_content=False,
+                       headers={'Content-Type': 'application/json'}, request_url=request.url)
+    return adapter.build_response(request, raw)
+
+class TestRequestPacing(unittest.TestCase):
+    """Only requests that reach the network wait for the host's slot."""
+
+    def setUp(self):
+        """Set up a scraper whose network sends return instantly."""
+        self.scraper = AdvancedNFLScraper()
+        send = mock.patch.object(HTTPAdapter, 'send', autospec=True, side_effect=_network_send)
+        sleep = mock.patch('advanced_nfl_scraper.time.sleep')
+        # A frozen clock makes each wait exactly the slots queued ahead of it
+        clock = mock.patch('advanced_nfl_scraper.time.monotonic', return_value=1000.0)
+        self.send = send.start()
+        self.sleep = sleep.start()
+        clock.start()
+        self.addCleanup(mock.patch.stopall)
+
+    @unittest.skipUnless(advanced_nfl_scraper.REQUESTS_CACHE_AVAILABLE, "requests-cache not installed")
+    def test_cached_fetches_do_not_sleep(self):
+        """Repeat fetches inside the cache TTL are served without pacing or network sends."""
+        url = 'https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard'
+        responses = [self.scraper.make_request(url) for _ in range(3)]
+
+        self.assertEqual(self.send.call_count, 1)
+        self.sleep.assert_not_called()
+        self.assertEqual([r.from_cache for r in responses], [False, True, True])
+
+    def test_network_fetches_are_paced(self):
+        """Distinct URLs on a rate-limited host wait for successive slots."""
+        for path in ('a', 'b', 'c'):
+            self.scraper.make_request(f'https://www.espn.com/nfl/{path}')
+
+        self.assertEqual(self.send.call_count, 3)
+        self.assertEqual([call.args[0] for call in self.sleep.call_args_list], [1.0, 2.0])
+
+    def test_unlimited_host_not_paced(self):
+        """Hosts without a minimum interval never wait."""
+        for path in ('a', 'b'):
+            self.scraper.make_request(f'https://sports.yahoo.com/nfl/{path}')
+
+        self.sleep.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
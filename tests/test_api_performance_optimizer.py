@@ -10,6 +10,7 @@ import os
 import time
 import json
 import sqlite3
+import threading
 from unittest.mock import patch, MagicMock
 import sys
 
@@ -21,7 +22,11 @@ from api_performance_optimizer import (
     DatabaseQueryOptimizer, 
     APICacheManager, 
     APIPerformanceOptimizer,
-    performance_monitor
+    performance_monitor,
+    register_request_attribution,
+    reset_request_endpoint,
+    set_request_endpoint,
+    RING_SIZE
 )
 
 class TestAPIPerformanceMonitor(unittest.TestCase):
@@ -77,6 +82,68 @@ class TestAPIPerformanceMonitor(unittest.TestCase):
         self.assertEqual(endpoint_stats['avg_time_ms'], 300.0)  # 0.3s * 1000
         self.assertEqual(endpoint_stats['min_time_ms'], 100.0)  # 0.1s * 1000
         self.assertEqual(endpoint_stats['max_time_ms'], 500.0)  # 0.5s * 1000
+    
+    def test_sample_window_keeps_most_recent(self):
+        """Test that only the most recent RING_SIZE samples are kept."""
+        for _ in range(RING_SIZE):
+            self.monitor.record_response_time("/api/test", "GET", 0.1, 200)
+        for _ in range(10):
+            self.monitor.record_response_time("/api/test", "GET", 0.9, 200)
+        
+        stats = self.monitor.get_performance_stats()["GET:/api/test"]
+        self.assertEqual(stats['request_count'], RING_SIZE)
+        self.assertEqual(stats['max_time_ms'], 900.0)
+        self.assertAlmostEqual(stats['avg_time_ms'], (0.1 * (RING_SIZE - 10) + 0.9 * 10) / RING_SIZE * 1000, places=1)
+    
+    def test_stats_for_uneven_endpoints(self):
+        """Test percentiles stay per-endpoint when sample counts differ."""
+        for i in range(1, 101):
+            self.monitor.record_response_time("/api/many", "GET", i / 1000, 200)
+        self.monitor.record_response_time("/api/one", "GET", 0.25, 200)
+        
+        stats = self.monitor.get_performance_stats()
+        self.assertEqual(stats["GET:/api/many"]['request_count'], 100)
+        self.assertEqual(stats["GET:/api/many"]['min_time_ms'], 1.0)
+        self.assertEqual(stats["GET:/api/many"]['p95_time_ms'], 96.0)
+        self.assertEqual(stats["GET:/api/one"]['request_count'], 1)
+        self.assertEqual(stats["GET:/api/one"]['p99_time_ms'], 250.0)
+    
+    def test_concurrent_recording(self):
+        """Test recording from many threads across endpoints."""
+        def record(endpoint):
+            for _ in range(100):
+                self.monitor.record_response_time(endpoint, "GET", 0.05, 200)
+        
+        threads = [threading.Thread(target=record, args=(f"/api/test{i % 4}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        stats = self.monitor.get_performance_stats()
+        self.assertEqual(len(stats), 4)
+        for i in range(4):
+            self.assertEqual(stats[f"GET:/api/test{i}"]['request_count'], 200)
+        
+    def test_background_aggregator(self):
+        """Test the aggregator thread merges buffered samples without a stats read."""
+        self.monitor.start_aggregator(interval=0.01)
+        try:
+            for _ in range(10):
+                self.monitor.record_response_time("/api/test", "GET", 0.05, 200)
+            
+            def merged():
+                return any("GET:/api/test" in shard for shard in self.monitor.response_times)
+            
+            deadline = time.time() + 2
+            while not merged() and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(merged())
+        finally:
+            self.monitor.stop_aggregator()
+        
+        stats = self.monitor.get_performance_stats()
+        self.assertEqual(stats["GET:/api/test"]['request_count'], 10)
 
 class TestDatabaseQueryOptimizer(unittest.TestCase):
     """Test cases for database query optimization."""
@@ -94,6 +161,7 @@ class TestDatabaseQueryOptimizer(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test database."""
+        self.optimizer.close()
         if os.path.exists(self.db_path):
             os.unlink(self.db_path)
     
@@ -145,6 +213,62 @@ class TestDatabaseQueryOptimizer(unittest.TestCase):
         self.assertEqual(stats['count'], 3)
         self.assertGreater(stats['total_time'], 0)
         self.assertGreater(stats['avg_time'], 0)
+    
+    def test_canned_query_uses_index(self):
+        """Test the season/config index is created and used by the ratings query."""
+        query = """
+            SELECT team, rating FROM team_ratings
+            WHERE season = ? AND config_name = ?
+            ORDER BY rating DESC
+        """
+        self.optimizer.execute_optimized_query(query, (2025, 'comprehensive'))
+        
+        plan = ' '.join(self.optimizer.query_cache[query])
+        self.assertIn('idx_team_ratings_season_config_rating', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+    
+    def test_unindexed_filter_logs_warning(self):
+        """Test a filtered full table scan is reported."""
+        with self.assertLogs('api_performance_optimizer', level='WARNING'):
+            self.optimizer.execute_optimized_query(
+                "SELECT team FROM team_ratings WHERE wins > ?", (12,)
+            )
+    
+    def test_connection_reused(self):
+        """Test that queries on one thread share a single tuned connection."""
+        with self.optimizer.get_connection() as first:
+            pass
+        self.optimizer.execute_optimized_query("SELECT COUNT(*) as count FROM team_ratings")
+        with self.optimizer.get_connection() as second:
+            journal_mode = second.execute("PRAGMA journal_mode").fetchone()[0]
+        
+        self.assertIs(first, second)
+        self.assertEqual(journal_mode.lower(), 'wal')
+    
+    def test_missing_database_directory(self):
+        """Test construction tolerates a database that cannot be opened yet."""
+        missing_path = os.path.join(tempfile.gettempdir(), 'no_such_dir_for_optimizer', 'stats.db')
+        
+        optimizer = DatabaseQueryOptimizer(missing_path)
+        
+        self.assertEqual(optimizer.db_path, missing_path)
+
+    def test_cursor_cache_bounded(self):
+        """Test that per-thread cursors are capped, closing the least recently used."""
+        queries = [f"SELECT team FROM team_ratings WHERE wins > {i}" for i in range(6)]
+        with patch('api_performance_optimizer.STATEMENT_CACHE_SIZE', 4):
+            for query in queries[:4]:
+                self.optimizer.execute_optimized_query(query)
+            evicted = self.optimizer._local.cursors[queries[1]]
+            first = self.optimizer._cursor(queries[0])
+            for query in queries[4:]:
+                self.optimizer.execute_optimized_query(query)
+
+        cursors = self.optimizer._local.cursors
+        self.assertEqual(list(cursors), [queries[3], queries[0], queries[4], queries[5]])
+        self.assertIs(cursors[queries[0]], first)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            evicted.execute(queries[1])
 
 class TestAPICacheManager(unittest.TestCase):
     """Test cases for API cache management."""
@@ -199,6 +323,19 @@ class TestAPICacheManager(unittest.TestCase):
         # Cache should not exceed max size
         self.assertLessEqual(len(self.cache_manager.cache), 5)
     
+    def test_cache_evicts_least_recently_used(self):
+        """Test that recently read entries survive eviction."""
+        for i in range(5):
+            self.cache_manager.set(f"/api/test{i}", {"id": i}, f"data{i}")
+        
+        # Touch the oldest entry so /api/test1 becomes least recently used
+        self.assertEqual(self.cache_manager.get("/api/test0", {"id": 0}), "data0")
+        self.cache_manager.set("/api/overflow", {"id": 999}, "overflow_data")
+        
+        self.assertEqual(self.cache_manager.get("/api/test0", {"id": 0}), "data0")
+        self.assertIsNone(self.cache_manager.get("/api/test1", {"id": 1}))
+        self.assertEqual(self.cache_manager.get("/api/overflow", {"id": 999}), "overflow_data")
+    
     def test_cache_key_generation(self):
         """Test cache key generation."""
         endpoint = "/api/test"
@@ -210,6 +347,15 @@ class TestAPICacheManager(unittest.TestCase):
         
         # Should generate same key regardless of param order
         self.assertEqual(key1, key2)
+    
+    def test_cache_key_distinguishes_params(self):
+        """Test cache keys are fixed-size and differ across endpoints and params."""
+        key = self.cache_manager.get_cache_key("/api/test", {"season": 2025})
+        
+        self.assertEqual(len(key), 16)
+        self.assertNotEqual(key, self.cache_manager.get_cache_key("/api/test", {"season": 2024}))
+        self.assertNotEqual(key, self.cache_manager.get_cache_key("/api/other", {"season": 2025}))
+        self.assertNotEqual(key, self.cache_manager.get_cache_key("/api/test", {}))
 
 class TestAPIPerformanceOptimizer(unittest.TestCase):
     """Test cases for main API performance optimizer."""
@@ -227,6 +373,7 @@ class TestAPIPerformanceOptimizer(unittest.TestCase):
     
     def tearDown(self):
         """Clean up test environment."""
+        self.optimizer.query_optimizer.close()
         if os.path.exists(self.db_path):
             os.unlink(self.db_path)
     
@@ -335,6 +482,67 @@ class TestAPIPerformanceOptimizer(unittest.TestCase):
         
         # Check result
         self.assertEqual(result, {"data": "test"})
+    
+    def test_performance_monitor_endpoint_label(self):
+        """Test decorator labels endpoints from the function name and counts errors."""
+        monitor = APIPerformanceMonitor()
+        
+        @performance_monitor(monitor)
+        def get_team_rankings(fail=False):
+            if fail:
+                raise ValueError("boom")
+            return []
+        
+        get_team_rankings()
+        with self.assertRaises(ValueError):
+            get_team_rankings(fail=True)
+        
+        stats = monitor.get_performance_stats()
+        self.assertEqual(list(stats), ["GET:team/rankings"])
+        self.assertEqual(stats["GET:team/rankings"]['request_count'], 2)
+        self.assertEqual(stats["GET:team/rankings"]['error_count'], 1)
+    
+    def test_performance_monitor_request_attribution(self):
+        """Test decorator records under the request endpoint when one is set."""
+        monitor = APIPerformanceMonitor()
+        
+        @performance_monitor(monitor)
+        def get_team_rankings():
+            return []
+        
+        token = set_request_endpoint("/api/teams/rankings", "POST")
+        try:
+            get_team_rankings()
+        finally:
+            reset_request_endpoint(token)
+        get_team_rankings()
+        
+        stats = monitor.get_performance_stats()
+        self.assertEqual(sorted(stats), ["GET:team/rankings", "POST:/api/teams/rankings"])
+    
+    def test_flask_request_attribution(self):
+        """Test Flask hooks attribute calls to the route template and method."""
+        try:
+            from flask import Flask
+        except ImportError:
+            self.skipTest("Flask not installed")
+        
+        monitor = APIPerformanceMonitor()
+        
+        @performance_monitor(monitor)
+        def load_team(team):
+            return {"team": team}
+        
+        app = register_request_attribution(Flask(__name__))
+        
+        @app.route('/api/elo/team/<team>', methods=['GET'])
+        def team_route(team):
+            return load_team(team)
+        
+        response = app.test_client().get('/api/elo/team/PHI')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(monitor.get_performance_stats()), ["GET:/api/elo/team/<team>"])
 
 class TestPerformanceOptimizationIntegration(unittest.TestCase):
     """Integration tests for performance optimization."""
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Tests for the API server's response caching, revalidation and Action Network endpoints,
+run through the Flask test client against a seeded stats database.
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import importlib
+import gzip
+import json
+import os
+import sys
+from unittest import mock
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.nfl_elo.action_network_storage import ActionNetworkStorage
+
+class TestAPIServer(unittest.TestCase):
+    """Test cases for the Action Network endpoints and their HTTP caching."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Seed a stats database where the server expects it and import the server there."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        # The server opens its databases relative to the working directory, with the ELO
+        # database two levels up
+        work_dir = os.path.join(cls.temp_dir.name, 'api', 'server')
+        os.makedirs(os.path.join(work_dir, 'artifacts', 'stats'))
+        sqlite3.connect(os.path.join(cls.temp_dir.name, 'nfl_elo.db')).close()
+        cls.stats_db = os.path.join(work_dir, 'artifacts', 'stats', 'nfl_elo_stats.db')
+        cls._seed(cls.stats_db)
+
+        cls.old_cwd = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            cls.api = importlib.import_module('api_server')
+        except ImportError as e:
+            os.chdir(cls.old_cwd)
+            cls.temp_dir.cleanup()
+            raise unittest.SkipTest(f"API server dependencies not installed: {e}")
+        cls.client = cls.api.app.test_client()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the pooled connections and remove the seeded database."""
+        cls.api._close_connections()
+        cls.api._tls.conns = {}
+        os.chdir(cls.old_cwd)
+        cls.temp_dir.cleanup()
+
+    @staticmethod
+    def _seed(db_path):
+        """Two experts, one with performance windows and more picks than the details limit."""
+        ActionNetworkStorage(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO action_network_experts (id, an_expert_id, name, username) VALUES (?, ?, ?, ?)",
+            [(1, 1001, 'Alpha', 'alpha'), (2, 1002, 'Beta', 'beta')]
+        )
+        conn.executemany(
+            "INSERT INTO action_network_expert_performance (expert_id, window_period, wins, losses, recorded_at) "
+            "VALUES (1, ?, ?, ?, ?)",
+            [('7d', 3, 2, '2025-09-01 10:00:00'), ('30d', 12, 9, '2025-09-02 10:00:00')]
+        )
+        conn.executemany(
+            "INSERT INTO action_network_teams (an_team_id, full_name, abbr, league_name) VALUES (?, ?, ?, 'nfl')",
+            [(1, 'Kansas City Chiefs', 'KC'), (2, 'Buffalo Bills', 'BUF')]
+        )
+        conn.execute(
+            "INSERT INTO action_network_games (an_game_id, league_name, home_team_id, away_team_id, game_status) "
+            "VALUES (501, 'nfl', 1, 2, 'complete')"
+        )
+        conn.executemany(
+            "INSERT INTO action_network_picks "
+            "(an_pick_id, expert_id, game_id, league_name, play_description, odds, result, created_at) "
+            "VALUES (?, ?, 501, 'nfl', ?, -110, ?, ?)",
+            [(p, 1 if p <= 25 else 2, f'Pick {p}', 'win' if p % 2 else 'loss', f'2025-09-{p:02d} 12:00:00')
+             for p in range(1, 31)]
+        )
+        conn.commit()
+        conn.close()
+
+    def setUp(self):
+        """Start every test with an empty response cache."""
+        self.api.response_cache.clear()
+
+    def test_ttl_cached_hit_and_miss(self):
+        """A repeated query is served from the cache; a different query string misses."""
+        experts = [{'name': f'Expert {i}', 'win_rate': 50.0 + i} for i in range(40)]
+        with mock.patch.object(self.api.analyzer, 'get_top_experts', return_value=experts) as get_top:
+            first = self.client.get('/api/action-network/experts?limit=40')
+            second = self.client.get('/api/action-network/experts?limit=40')
+            self.assertEqual(get_top.call_count, 1)
+            self.client.get('/api/action-network/experts?limit=39')
+            self.assertEqual(get_top.call_count, 2)
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first.get_json()['total'], 40)
+
+    def test_ttl_cached_etag_revalidation(self):
+        """Cached bodies answer a matching If-None-Match with 304, per content coding."""
+        experts = [{'name': f'Expert {i}', 'win_rate': 50.0 + i} for i in range(40)]
+        with mock.patch.object(self.api.analyzer, 'get_top_experts', return_value=experts):
+            plain = self.client.get('/api/action-network/experts')
+            compressed = self.client.get('/api/action-network/experts', headers={'Accept-Encoding': 'gzip'})
+            etag = plain.get_etag()[0]
+            not_modified = self.client.get('/api/action-network/experts', headers={'If-None-Match': f'"{etag}"'})
+            stale_coding = self.client.get('/api/action-network/experts',
+                                           headers={'If-None-Match': f'"{etag}"', 'Accept-Encoding': 'gzip'})
+
+        self.assertEqual(compressed.content_encoding, 'gzip')
+        self.assertEqual(gzip.decompress(compressed.data), plain.data)
+        self.assertEqual(compressed.get_etag()[0], f'{etag}-gzip')
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.data, b'')
+        self.assertEqual(stale_coding.status_code, 200)
+
+    def test_uncached_json_revalidation(self):
+        """Uncached JSON responses keep their ETag across polls despite the new timestamp."""
+        first = self.client.get('/api/action-network/experts/1001')
+        second = self.client.get('/api/action-network/experts/1001')
+        etag = first.get_etag()[0]
+        not_modified = self.client.get('/api/action-network/experts/1001', headers={'If-None-Match': f'"{etag}"'})
+
+        self.assertNotEqual(first.get_json()['timestamp'], second.get_json()['timestamp'])
+        self.assertEqual(second.get_etag()[0], etag)
+        self.assertTrue(first.cache_control.no_cache)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.data, b'')
+
+    def _picks_body(self, response, data=None):
+        """Response body with its request timestamp blanked out."""
+        data = response.data if data is None else data
+        return data.replace(json.loads(data)['timestamp'].encode(), b'')
+
+    def test_picks_stream_compressed_matches_plain(self):
+        """The compressed picks stream decodes to the same bytes as the plain one."""
+        url = '/api/action-network/picks?limit=50'
+        plain = self.client.get(url)
+        encodings = ['gzip', 'br'] if self.api.BROTLI_AVAILABLE else ['gzip']
+
+        self.assertIsNone(plain.content_encoding)
+        self.assertIn('Accept-Encoding', plain.vary)
+        self.assertEqual(plain.get_json()['total'], 30)
+        for encoding in encodings:
+            compressed = self.client.get(url, headers={'Accept-Encoding': encoding})
+            data = (gzip.decompress(compressed.data) if encoding == 'gzip'
+                    else self.api.brotli.decompress(compressed.data))
+
+            self.assertEqual(compressed.content_encoding, encoding)
+            self.assertEqual(self._picks_body(compressed, data), self._picks_body(plain))
+
+    def test_picks_filters_and_game_join(self):
+        """Filtered picks come newest first with their expert and teams."""
+        picks = self.client.get('/api/action-network/picks?expert_id=2&result=win').get_json()['picks']
+
+        self.assertEqual([p['pick_id'] for p in picks], [29, 27])
+        self.assertEqual(picks[0]['expert_name'], 'Beta')
+        self.assertEqual((picks[0]['home_team_abbr'], picks[0]['away_team_abbr']), ('KC', 'BUF'))
+
+    def test_expert_details_split(self):
+        """The single expert-details statement splits into expert, performance and recent picks."""
+        details = self.client.get('/api/action-network/experts/1001').get_json()
+        missing = self.client.get('/api/action-network/experts/9999')
+
+        self.assertEqual((details['expert']['id'], details['expert']['name']), (1001, 'Alpha'))
+        self.assertEqual([w['window_period'] for w in details['performance']], ['30d', '7d'])
+        self.assertEqual([p['pick_id'] for p in details['recent_picks']], list(range(25, 5, -1)))
+        self.assertEqual(missing.status_code, 404)
+
+    def test_expert_name_follows_inserts_and_renames(self):
+        """Picks served by the API pick up new experts and renames through the triggers."""
+        conn = sqlite3.connect(self.stats_db)
+        conn.execute("INSERT INTO action_network_experts (id, an_expert_id, name) VALUES (3, 1003, 'Gamma')")
+        conn.execute(
+            "INSERT INTO action_network_picks (an_pick_id, expert_id, league_name, created_at) "
+            "VALUES (100, 3, 'nba', '2025-10-01 12:00:00')"
+        )
+        conn.commit()
+        inserted = self.client.get('/api/action-network/picks?league=nba').get_json()['picks']
+        conn.execute("UPDATE action_network_experts SET name = 'Gamma Renamed' WHERE id = 3")
+        conn.commit()
+        conn.close()
+        renamed = self.client.get('/api/action-network/picks?league=nba').get_json()['picks']
+
+        self.assertEqual([p['expert_name'] for p in inserted], ['Gamma'])
+        self.assertEqual([p['expert_name'] for p in renamed], ['Gamma Renamed'])
+
+    def test_picks_fall_back_to_experts_join(self):
+        """Databases without the expert_name column are read through the experts join."""
+        conn = sqlite3.connect(':memory:')
+        conn.execute("CREATE TABLE action_network_picks (id INTEGER PRIMARY KEY, expert_id INTEGER)")
+        with mock.patch.object(self.api, '_picks_have_expert_name', False):
+            self.assertIs(self.api._picks_sql(conn), self.api.PICKS_EXPERTS_JOIN_SQL)
+        conn.close()
+
+if __name__ == '__main__':
+    unittest.main()
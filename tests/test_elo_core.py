@@ -7,6 +7,22 @@ from models.nfl_elo.ratings import TeamRating, RatingBook, OffDefRating
 from models.nfl_elo.updater import logistic_expectation, mov_multiplier, apply_game_update
 
 
+class TestEloConfig:
+    """Test EloConfig behavior."""
+    
+    def test_equal_configs_hash_equal(self):
+        """Configs with the same values should be interchangeable as dict keys."""
+        cfg_a = EloConfig(k=30.0, preseason_regress=0.5)
+        cfg_b = EloConfig(k=30.0, preseason_regress=0.5)
+        assert cfg_a == cfg_b
+        assert hash(cfg_a) == hash(cfg_b)
+        assert len({cfg_a, cfg_b}) == 1
+    
+    def test_different_configs_are_distinct(self):
+        """Configs differing in any field should not collide as keys."""
+        assert len({EloConfig(), EloConfig(k=30.0), EloConfig(hfa_points=0.0)}) == 3
+
+
 class TestLogisticExpectation:
     """Test logistic expectation function."""
     
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for the ELO Data Service rating history lookups.
+"""
+
+import unittest
+import sqlite3
+import tempfile
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ingest.nfl.elo_data_service import EloDataService
+
+class TestEloDataService(unittest.TestCase):
+    """Test cases for rating history and the ratings index."""
+    
+    def setUp(self):
+        """Set up a test database with stored ratings for 2024 only."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.db_path = self.temp_db.name
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""
+            CREATE TABLE team_ratings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                team TEXT NOT NULL,
+                season INTEGER NOT NULL,
+                week INTEGER NOT NULL,
+                rating REAL NOT NULL,
+                wins INTEGER DEFAULT 0,
+                losses INTEGER DEFAULT 0,
+                win_pct REAL DEFAULT 0.0,
+                rating_change REAL DEFAULT 0.0
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO team_ratings (team, season, week, rating) VALUES (?, 2024, 18, ?)",
+            [('KC', 1650.04), ('BUF', 1700.0), ('NYJ', 1400.0)]
+        )
+        conn.commit()
+        conn.close()
+        
+        self.service = EloDataService(self.db_path)
+    
+    def tearDown(self):
+        """Clean up test database."""
+        if os.path.exists(self.db_path):
+            os.unlink(self.db_path)
+    
+    def test_history_matches_season_ratings(self):
+        """Stored seasons report the same rating and rank as the season ratings."""
+        history = self.service.get_rating_history('KC', [2024])
+        season = {r['team']: r for r in self.service.get_team_ratings_for_season(2024)}
+        
+        self.assertEqual(history, [{'season': 2024, 'rating': 1650.0, 'rank': 2}])
+        self.assertEqual((season['KC']['rating'], season['KC']['rank']), (1650.0, 2))
+    
+    def test_history_falls_back_to_sample_seasons(self):
+        """Seasons without stored ratings use the sample ratings, in requested order."""
+        history = self.service.get_rating_history('KC', [2023, 2024])
+        sample = next(r for r in self.service._generate_sample_ratings(2023) if r['team'] == 'KC')
+        
+        self.assertEqual([h['season'] for h in history], [2023, 2024])
+        self.assertEqual(history[0], {'season': 2023, 'rating': sample['rating'], 'rank': sample['rank']})
+    
+    def test_history_skips_team_missing_from_stored_season(self):
+        """A team absent from a stored season has no entry for it."""
+        self.assertEqual(self.service.get_rating_history('DAL', [2024]), [])
+    
+    def test_ratings_index_created(self):
+        """The service creates the season/rating index on startup."""
+        conn = sqlite3.connect(self.db_path)
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'team_ratings'")}
+        conn.close()
+        
+        self.assertIn('idx_team_ratings_season_rating', indexes)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,10 @@
+"""WSGI entry point for the Action Network API server.
+
+Run with gunicorn, which picks up gunicorn.conf.py from the working directory:
+
+    gunicorn wsgi:app
+"""
+
+from api_server import app
+
+__all__ = ['app']